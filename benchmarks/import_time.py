@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+Super CC Import-Time Budget
+
+Runs quick CLI invocations in fresh interpreters and fails if they exceed the
+startup budget or pull in modules that only heavier commands need.
+
+Usage:
+    python benchmarks/import_time.py [--budget-ms 30] [--runs 7]
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List, Set, Tuple
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+DEFAULT_BUDGET_MS = 30.0
+
+# Invocations that run on the hot path and must stay within budget
+FAST_INVOCATIONS = [
+    ["--version"],
+    ["help"],
+]
+
+# Modules that only init/upgrade/validate may load
+FORBIDDEN_MODULES = {
+    "subprocess",
+    "datetime",
+    "filecmp",
+    "super_cc.installer",
+    "super_cc.integration",
+    "super_cc.profiling",
+    "super_cc.validation",
+}
+
+
+def run_cli(args: List[str], importtime: bool = False) -> Tuple[float, str]:
+    """Run the CLI in a fresh interpreter.
+
+    Returns:
+        Tuple of (wall time in milliseconds, stderr output)
+    """
+    cmd = [sys.executable]
+    if importtime:
+        cmd += ["-X", "importtime"]
+    # Mirror the console-script entry point so super_cc.cli shows up as an import
+    cmd += ["-c", "import sys; from super_cc.cli import main; sys.exit(main())"] + args
+    env = dict(os.environ, PYTHONPATH=str(REPO_ROOT), PYTHONDONTWRITEBYTECODE="")
+
+    start = time.perf_counter()
+    result = subprocess.run(cmd, capture_output=True, text=True, env=env, cwd=REPO_ROOT)
+    elapsed = (time.perf_counter() - start) * 1000
+    if result.returncode != 0:
+        raise RuntimeError(f"super-cc {' '.join(args)} failed: {result.stderr.strip()}")
+    return elapsed, result.stderr
+
+
+def imported_modules(importtime_output: str) -> Dict[str, int]:
+    """Parse ``-X importtime`` output into module -> cumulative microseconds."""
+    modules = {}
+    for line in importtime_output.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line.split("|")
+        cumulative = cumulative.strip()
+        if cumulative.isdigit():
+            modules[name.strip()] = int(cumulative)
+    return modules
+
+
+def check(budget_ms: float, runs: int) -> List[str]:
+    """Check every fast invocation against the budget.
+
+    Returns:
+        List of failure messages, empty if all invocations pass
+    """
+    failures = []
+    baseline = min(_run_python_noop() for _ in range(runs))
+    print(f"🧼 Bare interpreter startup: {baseline:.1f} ms")
+
+    for args in FAST_INVOCATIONS:
+        label = "super-cc " + " ".join(args)
+        best = min(run_cli(args)[0] for _ in range(runs))
+        _, trace = run_cli(args, importtime=True)
+        modules = imported_modules(trace)
+        cli_ms = modules.get("super_cc.cli", 0) / 1000
+        print(f"🫧 {label}: {best:.1f} ms wall, {cli_ms:.1f} ms importing super_cc.cli")
+
+        if best > budget_ms:
+            failures.append(f"{label} took {best:.1f} ms (budget {budget_ms:.0f} ms)")
+        leaked: Set[str] = FORBIDDEN_MODULES & set(modules)
+        if leaked:
+            failures.append(f"{label} imported {', '.join(sorted(leaked))}")
+    return failures
+
+
+def _run_python_noop() -> float:
+    """Time a bare interpreter start for reference."""
+    start = time.perf_counter()
+    subprocess.run([sys.executable, "-c", "pass"], check=True)
+    return (time.perf_counter() - start) * 1000
+
+
+def main() -> int:
+    """Entry point."""
+    parser = argparse.ArgumentParser(description="Enforce the super-cc startup budget")
+    parser.add_argument("--budget-ms", type=float, default=DEFAULT_BUDGET_MS, help="Wall time budget per invocation")
+    parser.add_argument("--runs", type=int, default=7, help="Runs per invocation; the fastest counts")
+    args = parser.parse_args()
+
+    failures = check(args.budget_ms, args.runs)
+    if failures:
+        print("\n❌ Import-time budget exceeded:")
+        for failure in failures:
+            print(f"   {failure}")
+        return 1
+    print("\n🫧 All invocations within budget")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
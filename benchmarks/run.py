@@ -0,0 +1,323 @@
+#!/usr/bin/env python3
+"""
+Super CC Benchmarks
+
+Times installer, upgrade, validation and merge operations, plus context index
+refreshes and shared-cache restores, against synthetic repositories and
+compares the results with a saved baseline.
+
+Each measurement runs in a fresh child process on a freshly generated repo,
+so peak RSS and I/O counters belong to that operation alone. Counters come
+from /proc/self/io and are reported as None on platforms without it.
+``rw_syscalls`` counts read- and write-class calls only (syscr + syscw);
+metadata calls such as stat, open and getdents are not included, so compare
+wall time for metadata-heavy regressions.
+
+Usage:
+    python benchmarks/run.py --save-baseline          # record a baseline first, on the base commit
+    python benchmarks/run.py                          # 1k and 10k scales, compared with the baseline
+    python benchmarks/run.py --scales 1k,10k,100k     # include the large repo (slow to generate)
+    python benchmarks/run.py --baseline other.json    # compare with a specific baseline
+
+Baselines are machine-specific, so none is committed. Without one the default
+run only warns; an explicitly given --baseline that does not exist is an error.
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import platform
+import resource
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, NamedTuple, Optional
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT))
+
+from benchmarks.synthetic import (  # noqa: E402
+    SCALES,
+    generate_repo,
+    generate_summaries,
+    generate_templates,
+)
+
+DEFAULT_OUTPUT = REPO_ROOT / "benchmarks" / "results" / "latest.json"
+DEFAULT_BASELINE = REPO_ROOT / "benchmarks" / "baseline.json"
+# Shared summary cache seeded for the cache_restore case, inside the repo under test
+SHARED_CACHE_DIR = ".bench-shared-cache"
+SUMMARIZER_VERSION = "bench"
+QUERIES = [
+    "which files implement authentication",
+    "session token refresh",
+    "invoice payment billing",
+    "queue worker scheduler",
+    "handle_search",
+]
+
+# Metric -> absolute change ignored as noise, in the metric's own unit
+NOISE_FLOORS = {
+    "wall_s": 0.005,
+    "rw_syscalls": 200,
+    "bytes_read": 256 * 1024,
+    "bytes_written": 256 * 1024,
+    "peak_rss_kb": 2048,
+}
+
+
+class Case(NamedTuple):
+    """A benchmarked operation."""
+
+    installed: bool
+    must_succeed: bool
+    run: Callable[[Path, Path], bool]
+    # Untimed setup run on the generated repo before the measurement
+    prepare: Optional[Callable[[Path], None]] = None
+
+
+def _install(repo: Path, templates: Path) -> bool:
+    from super_cc.installer import SuperCCInstaller
+
+    installer = SuperCCInstaller(repo)
+    installer.templates_dir = templates
+    return installer.install()
+
+
+def _upgrade(repo: Path, templates: Path) -> bool:
+    from super_cc.installer import SuperCCInstaller
+
+    installer = SuperCCInstaller(repo)
+    installer.templates_dir = templates
+    return installer.upgrade()
+
+
+def _validate(repo: Path, templates: Path) -> bool:
+    from super_cc.validation import validate_environment
+
+    return validate_environment(repo)
+
+
+def _merge(repo: Path, templates: Path) -> bool:
+    from super_cc.integration import ClaudeDirectoryManager
+
+    return ClaudeDirectoryManager(repo / ".claude", templates).merge_directories()
+
+
+def _context_refresh(repo: Path, templates: Path) -> bool:
+    from super_cc.context_index import SummaryIndex
+
+    index = SummaryIndex(repo)
+    updated, _ = index.refresh()  # Cold: index every summary
+    SummaryIndex(repo).refresh()  # Warm: stat-only no-op
+    found = [SummaryIndex(repo).query(text) for text in QUERIES]
+    return updated > 0 and all(found)
+
+
+def _prepare_summaries(repo: Path) -> None:
+    generate_summaries(repo)
+
+
+def _cache_restore(repo: Path, templates: Path) -> bool:
+    from super_cc.shared_cache import LocalCacheBackend, SharedSummaryCache
+
+    shared = repo / SHARED_CACHE_DIR
+    files = (shared / "files.txt").read_text().splitlines()
+    cache = SharedSummaryCache(repo, LocalCacheBackend(shared), SUMMARIZER_VERSION)
+    return len(cache.restore(files)) == len(files)
+
+
+def _prepare_shared_cache(repo: Path) -> None:
+    """Publish summaries of every source file, then remove the local copies."""
+    from super_cc.shared_cache import LocalCacheBackend, SharedSummaryCache
+
+    shared = repo / SHARED_CACHE_DIR
+    files = generate_summaries(repo)
+    with contextlib.redirect_stdout(io.StringIO()):
+        SharedSummaryCache(repo, LocalCacheBackend(shared), SUMMARIZER_VERSION).publish()
+    shutil.rmtree(repo / ".claude" / "context")
+    (shared / "files.txt").write_text("\n".join(files) + "\n")
+
+
+CASES: Dict[str, Case] = {
+    "install": Case(installed=False, must_succeed=True, run=_install),
+    "install_existing": Case(installed=True, must_succeed=True, run=_install),
+    "upgrade": Case(installed=True, must_succeed=True, run=_upgrade),
+    # Validation fails without the claude binary, but its cost is still real
+    "validate": Case(installed=True, must_succeed=False, run=_validate),
+    "merge": Case(installed=True, must_succeed=True, run=_merge),
+    # One summary per source file: cold and no-op index refreshes, then queries
+    "context_refresh": Case(installed=False, must_succeed=True, run=_context_refresh, prepare=_prepare_summaries),
+    "cache_restore": Case(installed=False, must_succeed=True, run=_cache_restore, prepare=_prepare_shared_cache),
+}
+
+
+def _read_proc_io() -> Optional[Dict[str, int]]:
+    """Read this process's I/O counters, or None if unavailable."""
+    try:
+        with open("/proc/self/io") as f:
+            return {key: int(value) for key, value in (line.split(": ") for line in f)}
+    except OSError:
+        return None
+
+
+def _child(case_name: str, repo: Path, templates: Path) -> int:
+    """Run one operation and print its metrics as JSON."""
+    case = CASES[case_name]
+    before = _read_proc_io()
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        ok = case.run(repo, templates)
+    wall = time.perf_counter() - start
+    after = _read_proc_io()
+
+    metrics = {
+        "wall_s": wall,
+        "rw_syscalls": None,
+        "bytes_read": None,
+        "bytes_written": None,
+        # ru_maxrss is kilobytes on Linux, bytes on macOS
+        "peak_rss_kb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss // (1024 if sys.platform == "darwin" else 1),
+        "ok": bool(ok),
+    }
+    if before is not None and after is not None:
+        metrics["rw_syscalls"] = (after["syscr"] - before["syscr"]) + (after["syscw"] - before["syscw"])
+        metrics["bytes_read"] = after["rchar"] - before["rchar"]
+        metrics["bytes_written"] = after["wchar"] - before["wchar"]
+    print(json.dumps(metrics))
+    return 0
+
+
+def measure(case_name: str, scale_name: str, workdir: Path, templates: Path, repeat: int) -> Dict[str, Any]:
+    """Measure one case at one scale, keeping the fastest of ``repeat`` runs."""
+    case = CASES[case_name]
+    runs: List[Dict[str, Any]] = []
+    for attempt in range(repeat):
+        repo = generate_repo(workdir / f"{case_name}-{scale_name}-{attempt}", SCALES[scale_name], case.installed, templates)
+        if case.prepare is not None:
+            case.prepare(repo)
+        result = subprocess.run(
+            [sys.executable, __file__, "--child", case_name, str(repo), str(templates)],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        metrics = json.loads(result.stdout.strip().splitlines()[-1])
+        if case.must_succeed and not metrics["ok"]:
+            raise RuntimeError(f"{case_name} failed on the {scale_name} repository")
+        runs.append(metrics)
+    return min(runs, key=lambda m: m["wall_s"])
+
+
+def compare(current: Dict[str, Dict], baseline: Dict[str, Dict], tolerance: float, counter_tolerance: float) -> List[str]:
+    """Compare results with a baseline.
+
+    Args:
+        current: Results keyed by "case/scale"
+        baseline: Baseline results in the same shape
+        tolerance: Allowed relative increase in wall time
+        counter_tolerance: Allowed relative increase in I/O counters and RSS
+
+    Returns:
+        List of regression messages
+    """
+    regressions = []
+    for key, metrics in sorted(current.items()):
+        base = baseline.get(key)
+        if base is None:
+            continue
+        for metric, floor in NOISE_FLOORS.items():
+            now, before = metrics.get(metric), base.get(metric)
+            if now is None or before is None:
+                continue
+            allowed = tolerance if metric == "wall_s" else counter_tolerance
+            if now > before * (1 + allowed) and now - before > floor:
+                change = (now / before - 1) * 100 if before else float("inf")
+                regressions.append(f"{key} {metric}: {before:,.3f} -> {now:,.3f} (+{change:.0f}%)")
+    return regressions
+
+
+def _format_row(key: str, metrics: Dict[str, Any]) -> str:
+    def fmt(value: Any, scale: float = 1, unit: str = "") -> str:
+        if value is None:
+            return "n/a"
+        return f"{value:,}" if not unit else f"{value / scale:,.1f}{unit}"
+
+    return (
+        f"   {key:<24} {fmt(metrics['wall_s'], 0.001, ' ms'):>12} "
+        f"{fmt(metrics['rw_syscalls'], 1, ''):>12} {fmt(metrics['bytes_read'], 1024 * 1024, ' MiB'):>12} "
+        f"{fmt(metrics['bytes_written'], 1024 * 1024, ' MiB'):>12} {fmt(metrics['peak_rss_kb'], 1024, ' MiB'):>10}"
+    )
+
+
+def main() -> int:
+    """Entry point."""
+    if len(sys.argv) == 5 and sys.argv[1] == "--child":
+        return _child(sys.argv[2], Path(sys.argv[3]), Path(sys.argv[4]))
+
+    parser = argparse.ArgumentParser(description="Benchmark Super CC operations")
+    parser.add_argument("--scales", default="1k,10k", help=f"Comma-separated scales ({', '.join(SCALES)})")
+    parser.add_argument("--cases", default=",".join(CASES), help="Comma-separated cases to run")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per case; the fastest is kept")
+    parser.add_argument("--output", type=Path, default=DEFAULT_OUTPUT, help="Where to write results JSON")
+    parser.add_argument("--baseline", type=Path, help=f"Baseline JSON to compare against (default: {DEFAULT_BASELINE.relative_to(REPO_ROOT)})")
+    parser.add_argument("--save-baseline", action="store_true", help="Write results to the baseline path too")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="Allowed wall time increase (fraction)")
+    parser.add_argument("--counter-tolerance", type=float, default=0.10, help="Allowed counter/RSS increase (fraction)")
+    args = parser.parse_args()
+
+    scales = [s for s in args.scales.split(",") if s]
+    cases = [c for c in args.cases.split(",") if c]
+    unknown = [s for s in scales if s not in SCALES] + [c for c in cases if c not in CASES]
+    if unknown:
+        parser.error(f"unknown scale or case: {', '.join(unknown)}")
+    if args.baseline is not None and not args.save_baseline and not args.baseline.exists():
+        parser.error(f"baseline {args.baseline} does not exist")
+
+    results: Dict[str, Dict] = {}
+    with tempfile.TemporaryDirectory(prefix="super-cc-bench-") as tmp:
+        workdir = Path(tmp)
+        templates = generate_templates(workdir / "templates")
+        print(f"   {'case/scale':<24} {'wall':>12} {'rw syscalls':>12} {'read':>12} {'written':>12} {'peak RSS':>10}")
+        for scale_name in scales:
+            for case_name in cases:
+                key = f"{case_name}/{scale_name}"
+                results[key] = measure(case_name, scale_name, workdir, templates, args.repeat)
+                print(_format_row(key, results[key]))
+
+    report = {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "results": results,
+    }
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    args.output.write_text(json.dumps(report, indent=2) + "\n")
+    print(f"\n🫧 Results written to {args.output}")
+
+    baseline_path = args.baseline or DEFAULT_BASELINE
+    if args.save_baseline:
+        baseline_path.write_text(json.dumps(report, indent=2) + "\n")
+        print(f"🫧 Baseline saved to {baseline_path}")
+        return 0
+
+    if not baseline_path.exists():
+        print(f"⚠️  No baseline at {baseline_path}; run with --save-baseline to create one")
+        return 0
+
+    baseline = json.loads(baseline_path.read_text())["results"]
+    regressions = compare(results, baseline, args.tolerance, args.counter_tolerance)
+    if regressions:
+        print("\n❌ PERFORMANCE REGRESSIONS:")
+        for regression in regressions:
+            print(f"   {regression}")
+        return 1
+    print("🫧 No regressions against baseline")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,162 @@
+"""
+Synthetic repositories for Super CC benchmarks.
+
+Generates source trees, existing .claude installs with large logs/ and state/
+directories, context summaries of the source files, and a template directory
+shaped like the packaged one.
+"""
+
+import json
+import shutil
+from pathlib import Path
+from typing import Dict, List, NamedTuple
+
+FILE_BODY = "def handler(request):\n    return {'status': 'ok'}\n" * 8
+
+
+class Scale(NamedTuple):
+    """Size parameters for one synthetic repository."""
+
+    files: int
+    depth: int
+    fanout: int
+    log_files: int
+    state_files: int
+
+
+SCALES: Dict[str, Scale] = {
+    "1k": Scale(files=1_000, depth=4, fanout=4, log_files=100, state_files=100),
+    "10k": Scale(files=10_000, depth=6, fanout=5, log_files=1_000, state_files=1_000),
+    "100k": Scale(files=100_000, depth=8, fanout=6, log_files=10_000, state_files=10_000),
+}
+
+# Mirrors the names validate_environment expects so validation runs every check
+AGENTS = [
+    "architect", "cache-manager", "context-synth", "debugger", "documenter",
+    "incremental-analyzer", "planner", "reviewer", "tester", "workflow-orchestrator",
+]
+COMMANDS = ["context-synth", "context", "review", "tdd", "workflow"]
+HOOKS = ["pre_tool_use", "post_tool_use"]
+WORKFLOWS = ["feature-development", "bug-fix", "refactoring", "review-only"]
+
+# Vocabulary for generated summaries, so index terms have realistic spread
+ROLE_WORDS = [
+    "authentication", "session", "token", "billing", "invoice", "payment", "search",
+    "indexing", "cache", "storage", "migration", "schema", "routing", "middleware",
+    "logging", "metrics", "tracing", "config", "parser", "renderer", "template",
+    "upload", "download", "queue", "worker", "scheduler", "notification", "email",
+    "permission", "audit", "export", "import", "validation", "serializer", "client",
+]
+
+
+def generate_templates(root: Path) -> Path:
+    """Create a template .claude directory.
+
+    Args:
+        root: Directory to create the templates in
+
+    Returns:
+        Path to the generated .claude template directory
+    """
+    claude = root / ".claude"
+    for subdir in ("agents", "commands", "hooks", "workflows", "context"):
+        (claude / subdir).mkdir(parents=True, exist_ok=True)
+    for name in AGENTS:
+        (claude / "agents" / f"{name}.md").write_text(f"---\nname: {name}\n---\n\n{name} agent\n")
+    for name in COMMANDS:
+        (claude / "commands" / f"{name}.md").write_text(f"# /{name}\n")
+    for name in HOOKS:
+        (claude / "hooks" / f"{name}.sh").write_text("#!/bin/sh\nexit 0\n")
+    for name in WORKFLOWS:
+        (claude / "workflows" / f"{name}.yaml").write_text(f"name: {name}\nsteps: []\n")
+    (claude / "settings.json").write_text("{}\n")
+    return claude
+
+
+def generate_repo(root: Path, scale: Scale, installed: bool, templates: Path) -> Path:
+    """Create a synthetic repository.
+
+    Source files are spread over a wide tree ``scale.depth`` levels deep plus
+    one much deeper chain, so traversal costs resemble a real monorepo.
+
+    Args:
+        root: Directory to create the repository in
+        scale: Size parameters
+        installed: Whether to include an existing .claude install with
+            populated logs/ and state/ directories
+        templates: Template directory to seed an existing install from
+
+    Returns:
+        Path to the repository
+    """
+    root.mkdir(parents=True, exist_ok=True)
+    (root / ".gitignore").write_text("node_modules/\n*.pyc\n.venv/\n")
+    (root / "pyproject.toml").write_text("[project]\nname = 'synthetic'\n")
+
+    directories = _tree(root / "src", scale.depth, scale.fanout, scale.files // 20 or 1)
+    # One narrow chain much deeper than the rest, like vendored or generated code
+    deep = root / "deep"
+    for level in range(scale.depth * 4):
+        deep = deep / f"level_{level}"
+        directories.append(deep)
+    deep.mkdir(parents=True)
+    for index in range(scale.files):
+        directory = directories[index % len(directories)]
+        (directory / f"module_{index}.py").write_text(FILE_BODY)
+
+    if installed:
+        claude = root / ".claude"
+        shutil.copytree(templates, claude)
+        for name, count in (("logs", scale.log_files), ("state", scale.state_files)):
+            target = claude / name
+            target.mkdir(exist_ok=True)
+            for index in range(count):
+                (target / f"{name}_{index}.json").write_text(f'{{"entry": {index}}}\n' * 16)
+    return root
+
+
+def _tree(base: Path, depth: int, fanout: int, limit: int) -> List[Path]:
+    """Create up to ``limit`` nested directories, breadth-first."""
+    base.mkdir(parents=True, exist_ok=True)
+    created = [base]
+    frontier = [(base, 0)]
+    while frontier and len(created) < limit:
+        directory, level = frontier.pop(0)
+        if level >= depth:
+            continue
+        for child_index in range(fanout):
+            child = directory / f"pkg_{level}_{child_index}"
+            child.mkdir(exist_ok=True)
+            created.append(child)
+            frontier.append((child, level + 1))
+            if len(created) >= limit:
+                break
+    return created
+
+
+
+def generate_summaries(repo: Path) -> List[str]:
+    """Write a single-file context summary for every generated source file.
+
+    Args:
+        repo: Repository created by generate_repo()
+
+    Returns:
+        Repo-relative paths of the summarized files
+    """
+    summaries = repo / ".claude" / "context" / "summaries"
+    summaries.mkdir(parents=True, exist_ok=True)
+    paths = sorted(p.relative_to(repo).as_posix() for p in (repo / "src").rglob("module_*.py"))
+    words = len(ROLE_WORDS)
+    for index, rel_path in enumerate(paths):
+        role, other = ROLE_WORDS[index % words], ROLE_WORDS[(index * 7 + 3) % words]
+        summary = {
+            "path": rel_path,
+            "main_roles": [f"{role} request handler", f"{other} helpers"],
+            "apis": [f"handle_{role}_{index}", f"{other}_status"],
+            "dependencies": [ROLE_WORDS[(index * 13 + 5) % words]],
+            "todos": [f"cover {role} edge cases"] if index % 10 == 0 else [],
+        }
+        name = rel_path.replace("/", "__") + "_summary.json"
+        (summaries / name).write_text(json.dumps(summary))
+    return paths
@@ -5,6 +5,6 @@ This package provides a complete Claude Code multi-agent development workflow sy
 with specialized AI agents, automated workflows, and intelligent caching.
 """
 
-__version__ = "1.0.0"
+__version__ = "1.0.2"
 __author__ = "Xander Hnasko"
 __description__ = "Transform any repository into a high-productivity AI development environment"
\ No newline at end of file
@@ -0,0 +1,70 @@
+"""
+Super CC Subcommands
+
+Each subcommand lives in its own module exposing ``add_arguments(parser)`` and
+``run(args) -> int``. Modules are imported only when their command is invoked,
+so quick invocations never pay for the installer or validator.
+"""
+
+import argparse
+from importlib import import_module
+from types import ModuleType
+
+# Command name -> (module name, one-line help)
+COMMANDS = {
+    "init": ("init", "Initialize Super CC environment"),
+    "validate": ("validate", "Validate current setup"),
+    "upgrade": ("upgrade", "Update to latest agents/commands"),
+    "context": ("context", "Search context-synthesis summaries"),
+    "watch": ("watch", "Keep context summaries fresh as files change"),
+    "cache": ("cache", "Share context summaries across clones"),
+    "test-impact": ("test_impact", "Select tests affected by recent changes"),
+    "help": ("help", "Show all available commands and workflows"),
+}
+
+
+def load_command(name: str) -> ModuleType:
+    """Import the module implementing a subcommand.
+
+    Args:
+        name: Command name as typed on the command line
+
+    Returns:
+        The subcommand module
+    """
+    module_name, _ = COMMANDS[name]
+    return import_module(f".{module_name}", __name__)
+
+
+def add_path_argument(parser: argparse.ArgumentParser) -> None:
+    """Add the optional repository path argument shared by most commands."""
+    parser.add_argument(
+        "path",
+        nargs="?",
+        default=".",
+        help="Path to repository (default: current directory)"
+    )
+
+
+def add_shared_dir_argument(parser: argparse.ArgumentParser) -> None:
+    """Add the --shared-dir option selecting the shared summary cache."""
+    parser.add_argument(
+        "--shared-dir",
+        metavar="DIR",
+        help="Shared summary cache directory, or 'user' for ~/.cache/super-cc "
+             "(default: $SUPER_CC_SHARED_CACHE)"
+    )
+
+
+def add_profile_arguments(parser: argparse.ArgumentParser) -> None:
+    """Add the --profile and --profile-trace options."""
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="Print a per-phase timing breakdown"
+    )
+    parser.add_argument(
+        "--profile-trace",
+        metavar="FILE",
+        help="Also write Chrome trace JSON to FILE (implies --profile)"
+    )
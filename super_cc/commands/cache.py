@@ -0,0 +1,94 @@
+"""super-cc cache: share context summaries across clones and worktrees."""
+
+import argparse
+import json
+from pathlib import Path
+from typing import Dict, List
+
+from . import add_path_argument, add_profile_arguments, add_shared_dir_argument
+
+
+def add_arguments(parser: argparse.ArgumentParser) -> None:
+    """Configure the cache subcommands."""
+    actions = parser.add_subparsers(dest="cache_command", metavar="{pull,push,stats}")
+    actions.required = True
+
+    for name, help_text in (
+        ("pull", "Restore summaries for files another clone already summarized"),
+        ("push", "Publish this clone's summaries to the shared cache"),
+        ("stats", "Show shared cache hit and miss counters"),
+    ):
+        action_parser = actions.add_parser(name, help=help_text)
+        add_path_argument(action_parser)
+        add_shared_dir_argument(action_parser)
+        add_profile_arguments(action_parser)
+
+
+def run(args: argparse.Namespace) -> int:
+    """Run a cache subcommand."""
+    from ..shared_cache import SharedSummaryCache
+
+    repo_path = Path(args.path)
+    if args.cache_command == "stats":
+        return _show_stats(repo_path)
+
+    cache = SharedSummaryCache.from_config(repo_path, args.shared_dir)
+    if cache is None:
+        print("❌ No shared cache configured. Use --shared-dir or set SUPER_CC_SHARED_CACHE.")
+        return 1
+
+    if args.cache_command == "push":
+        stored = cache.publish()
+        print(f"🫧 Published {stored} summaries to {cache.backend.root}")
+    else:
+        restored = cache.restore(_unsummarized_files(cache.repo_path))
+        print(f"🫧 Restored {len(restored)} summaries from {cache.backend.root}")
+        if restored:
+            from ..context_index import SummaryIndex
+
+            SummaryIndex(cache.repo_path).refresh()
+
+    session = cache.stats()
+    totals = cache.flush_stats()
+    print(f"   This run: {_format(session)}")
+    print(f"   All runs: {_format(totals)}")
+    return 0
+
+
+def _unsummarized_files(repo_path: Path) -> List[str]:
+    """List unignored source files that have no indexed summary yet."""
+    from ..context_index import SummaryIndex, is_summarizable
+    from ..ecosystems import VENDORED_DIRS
+    from ..gitignore import GitignoreMatcher, walk
+    from ..integration import GitignoreManager
+
+    index = SummaryIndex(repo_path)
+    index.refresh()
+    summarized = set(index.paths())
+    matcher = GitignoreMatcher(repo_path, GitignoreManager.CLAUDE_ENTRIES)
+    files = []
+    for rel_dir, _, entries in walk(matcher, skip=VENDORED_DIRS):
+        for entry in entries:
+            rel_path = f"{rel_dir}/{entry.name}" if rel_dir else entry.name
+            if is_summarizable(rel_path) and rel_path not in summarized:
+                files.append(rel_path)
+    return files
+
+
+def _show_stats(repo_path: Path) -> int:
+    stats_path = repo_path / ".claude" / "state" / "cache-stats.json"
+    try:
+        totals = json.loads(stats_path.read_text()).get("shared_cache")
+    except (OSError, ValueError):
+        totals = None
+    if not totals:
+        print("🫧 No shared cache activity recorded yet")
+        return 0
+    print(f"🫧 Shared cache ({totals.get('backend', 'unknown')}): {_format(totals)}")
+    return 0
+
+
+def _format(totals: Dict) -> str:
+    hit_rate = totals.get("hit_rate")
+    rate = "n/a" if hit_rate is None else f"{hit_rate:.0%}"
+    return f"{totals['hits']} hits, {totals['misses']} misses, {totals['stores']} stores, hit rate {rate}"
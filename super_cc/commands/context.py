@@ -0,0 +1,68 @@
+"""super-cc context: search and index context-synthesis summaries."""
+
+import argparse
+from pathlib import Path
+
+from . import add_profile_arguments
+
+
+def add_arguments(parser: argparse.ArgumentParser) -> None:
+    """Configure the context subcommands."""
+    actions = parser.add_subparsers(dest="context_command", metavar="{query,index}")
+    actions.required = True
+
+    query_parser = actions.add_parser("query", help="Rank summaries matching a question")
+    query_parser.add_argument("text", help="Free-text query, e.g. 'authentication'")
+    query_parser.add_argument(
+        "-k", "--top",
+        type=int,
+        default=10,
+        help="Number of results to return (default: 10)"
+    )
+    query_parser.add_argument(
+        "--path",
+        default=".",
+        help="Path to repository (default: current directory)"
+    )
+    query_parser.add_argument(
+        "--json",
+        action="store_true",
+        help="Print results as JSON lines"
+    )
+    add_profile_arguments(query_parser)
+
+    index_parser = actions.add_parser("index", help="Update the summary index")
+    index_parser.add_argument(
+        "path",
+        nargs="?",
+        default=".",
+        help="Path to repository (default: current directory)"
+    )
+    add_profile_arguments(index_parser)
+
+
+def run(args: argparse.Namespace) -> int:
+    """Run a context subcommand."""
+    from ..context_index import SummaryIndex
+
+    index = SummaryIndex(Path(args.path))
+    updated, removed = index.refresh()
+
+    if args.context_command == "index":
+        print(f"🫧 Summary index updated: {updated} re-indexed, {removed} removed")
+        return 0
+
+    results = index.query(args.text, limit=args.top)
+    if args.json:
+        import json
+
+        for result in results:
+            print(json.dumps(result._asdict()))
+        return 0
+
+    if not results:
+        print("🫧 No matching summaries")
+        return 0
+    for result in results:
+        print(f"{result.score:7.2f}  {result.path}")
+    return 0
@@ -0,0 +1,88 @@
+"""super-cc help: print the full command and workflow reference."""
+
+import argparse
+
+
+def add_arguments(parser: argparse.ArgumentParser) -> None:
+    """The help command takes no arguments."""
+
+
+def run(args: argparse.Namespace) -> int:
+    """Run the help command."""
+    show_help()
+    return 0
+
+
+def show_help() -> None:
+    """Display comprehensive help for Super CC commands and workflows."""
+    print()
+    print("🫧" * 52)
+    print("🫧🫧 Super CC: Multi-Agent Claude Code Environment 🫧🫧")
+    print("🫧" * 52)
+    print()
+    
+    print("🧼 CLI COMMANDS:")
+    print("  super-cc init [path]     Initialize Super CC environment")
+    print("  super-cc validate [path] Validate current setup")
+    print("  super-cc upgrade [path]  Update to latest agents/commands") 
+    print("  super-cc context query \"text\"  Rank context summaries by relevance")
+    print("  super-cc context index [path]  Refresh the summary search index")
+    print("  super-cc watch [path]    Re-summarize files as they change")
+    print("  super-cc cache pull|push Share summaries across clones and worktrees")
+    print("  super-cc test-impact select  Print the tests affected by recent changes")
+    print("  super-cc help           Show this help information")
+    print()
+    
+    print("🧼 CLAUDE CHAT COMMANDS (available after initialization):")
+    print()
+    
+    print("  🫧 Core Development:")
+    print("    /tdd \"feature description\"    Start complete TDD cycle")
+    print("    /review                        Multi-pass code review")
+    print("    /workflow <name> [options]     Execute YAML workflows")
+    print()
+    
+    print("  🫧 Context & Analysis:")
+    print("    /context \"pattern\"            Analyze project structure")
+    print("    /context-synth \"glob/pattern\" Create JSON context digest")
+    print("    /agent-status                  Per-agent performance tracking")
+    print()
+    
+    print("  🫧 Performance & Optimization:")
+    print("    /cache-status                  Cache hit rates and efficiency")
+    print("    /cache-optimize                Performance optimization tips")
+    print("    /token-usage                   Token consumption analysis")
+    print("    /eco-mode <mode>               Set performance mode")
+    print()
+    
+    print("  🫧 State Management:")
+    print("    /revert                        Rollback to last good state")
+    print("    /revert --commit <hash>        Revert to specific commit")
+    print()
+    
+    print("🧼 AVAILABLE WORKFLOWS:")
+    print("  /workflow feature-development  Complete TDD workflow for new features")
+    print("  /workflow bug-fix             Diagnostic workflow for bug resolution")
+    print("  /workflow refactoring         Code cleanup and improvement workflow")
+    print("  /workflow review-only         Comprehensive code review pipeline")
+    print()
+    
+    print("🧼 AGENT TRIGGER PATTERNS (use in natural language):")
+    print("  \"Plan the implementation...\"   → Planner Agent")
+    print("  \"Write tests for...\"          → Tester Agent")
+    print("  \"Review this code...\"         → Reviewer Agent")
+    print("  \"Debug this error...\"         → Debugger Agent")
+    print("  \"Design the architecture...\"  → Architect Agent")
+    print("  \"Document this feature...\"    → Documenter Agent")
+    print("  \"Analyze the codebase...\"     → Context Synthesizer")
+    print("  \"Orchestrate this workflow...\" → Workflow Orchestrator")
+    print()
+    
+    print("🧼 QUICK START:")
+    print("  1. cd your-project")
+    print("  2. super-cc init")
+    print("  3. claude chat")
+    print("  4. Try: /tdd \"implement user authentication\"")
+    print()
+    
+    print("🧼 More info: https://github.com/xanderhnasko/super-cc")
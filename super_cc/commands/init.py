@@ -0,0 +1,43 @@
+"""super-cc init: install the Super CC environment into a repository."""
+
+import argparse
+from pathlib import Path
+
+from . import add_path_argument, add_profile_arguments
+
+
+def add_arguments(parser: argparse.ArgumentParser) -> None:
+    """Configure arguments for the init command."""
+    add_path_argument(parser)
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Force initialization even if .claude directory exists"
+    )
+    parser.add_argument(
+        "--backup",
+        action="store_true",
+        default=True,
+        help="Create backup of existing .claude directory (default: True)"
+    )
+    add_profile_arguments(parser)
+
+
+def run(args: argparse.Namespace) -> int:
+    """Run the init command."""
+    from ..installer import SuperCCInstaller
+
+    installer = SuperCCInstaller(Path(args.path))
+    result = installer.install(force=args.force, backup=args.backup)
+    if not result:
+        print("❌ Installation failed. Check error messages above.")
+        return 1
+
+    print("🫧 Super CC initialized successfully!")
+    print(f"   Repository: {Path(args.path).resolve()}")
+    print("   Next steps:")
+    print("   1. cd to your repository")
+    print("   2. Run: claude chat")
+    print("   3. Try: /tdd 'your feature description'")
+    print("   4. Use: super-cc help (to see all commands & workflows)")
+    return 0
@@ -0,0 +1,112 @@
+"""super-cc test-impact: select the tests affected by recent changes."""
+
+import argparse
+import shlex
+from pathlib import Path
+
+from . import add_profile_arguments
+
+
+def add_arguments(parser: argparse.ArgumentParser) -> None:
+    """Configure the test-impact subcommands."""
+    from ..testimpact import DEFAULT_FULL_EVERY, RUNNERS
+
+    actions = parser.add_subparsers(dest="impact_command", metavar="{ingest,select}")
+    actions.required = True
+
+    ingest_parser = actions.add_parser("ingest", help="Add coverage data to the file-to-tests index")
+    ingest_parser.add_argument("coverage", help="coverage.py data file (.coverage) or lcov tracefile")
+    ingest_parser.add_argument(
+        "--runner",
+        choices=RUNNERS,
+        help="Runner owning the tests (default: pytest for .coverage, vitest for lcov)"
+    )
+    ingest_parser.add_argument(
+        "--test-name",
+        help="Test id for lcov data recorded from a single test"
+    )
+    ingest_parser.add_argument(
+        "--path",
+        default=".",
+        help="Path to repository (default: current directory)"
+    )
+    add_profile_arguments(ingest_parser)
+
+    select_parser = actions.add_parser("select", help="Print test commands for changed files")
+    select_parser.add_argument(
+        "--since",
+        metavar="REF",
+        help="Diff against REF (default: .claude/context/last-build-commit)"
+    )
+    select_parser.add_argument(
+        "--changed",
+        nargs="+",
+        metavar="FILE",
+        help="Use these changed files instead of asking git"
+    )
+    select_parser.add_argument(
+        "--full-every",
+        type=int,
+        default=DEFAULT_FULL_EVERY,
+        help=f"Run the full suite every N selections, 0 to disable (default: {DEFAULT_FULL_EVERY})"
+    )
+    select_parser.add_argument(
+        "--full",
+        action="store_true",
+        help="Force a full run"
+    )
+    select_parser.add_argument(
+        "--json",
+        action="store_true",
+        help="Print the selection as JSON"
+    )
+    select_parser.add_argument(
+        "--path",
+        default=".",
+        help="Path to repository (default: current directory)"
+    )
+    add_profile_arguments(select_parser)
+
+
+def run(args: argparse.Namespace) -> int:
+    """Run a test-impact subcommand."""
+    from ..testimpact import TestImpactIndex, build_commands, changed_files
+
+    index = TestImpactIndex(Path(args.path))
+
+    if args.impact_command == "ingest":
+        try:
+            count = index.ingest(Path(args.coverage), runner=args.runner, test_name=args.test_name)
+        except (OSError, ValueError) as e:
+            print(f"❌ Could not ingest coverage: {e}")
+            return 1
+        print(f"🫧 Indexed {count} tests ({len(index.tests)} total, {len(index.files)} files)")
+        return 0
+
+    try:
+        changed = args.changed if args.changed else changed_files(Path(args.path), args.since)
+    except ValueError as e:
+        print(f"❌ {e}")
+        return 1
+
+    selection = index.select(changed, full_every=args.full_every, force_full=args.full)
+    commands = index.full_commands() if selection.full else build_commands(selection)
+
+    if args.json:
+        import json
+
+        print(json.dumps({
+            "full": selection.full,
+            "reason": selection.reason,
+            "changed": selection.changed,
+            "tests": selection.tests,
+            "commands": commands,
+        }, indent=2))
+        return 0
+
+    print(f"# {selection.reason} ({len(selection.changed)} changed files)")
+    if not commands:
+        print("# Run the full test suite" if selection.full else "# No affected tests")
+    for command in commands:
+        print(" ".join(shlex.quote(part) for part in command))
+    return 0
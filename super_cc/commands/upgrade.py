@@ -0,0 +1,25 @@
+"""super-cc upgrade: merge the latest templates into an existing install."""
+
+import argparse
+from pathlib import Path
+
+from . import add_path_argument, add_profile_arguments
+
+
+def add_arguments(parser: argparse.ArgumentParser) -> None:
+    """Configure arguments for the upgrade command."""
+    add_path_argument(parser)
+    add_profile_arguments(parser)
+
+
+def run(args: argparse.Namespace) -> int:
+    """Run the upgrade command."""
+    from ..installer import SuperCCInstaller
+
+    installer = SuperCCInstaller(Path(args.path))
+    if not installer.upgrade():
+        print("❌ Upgrade failed. Check error messages above.")
+        return 1
+
+    print("🫧 Super CC environment upgraded successfully!")
+    return 0
@@ -0,0 +1,24 @@
+"""super-cc validate: check an installed Super CC environment."""
+
+import argparse
+from pathlib import Path
+
+from . import add_path_argument, add_profile_arguments
+
+
+def add_arguments(parser: argparse.ArgumentParser) -> None:
+    """Configure arguments for the validate command."""
+    add_path_argument(parser)
+    add_profile_arguments(parser)
+
+
+def run(args: argparse.Namespace) -> int:
+    """Run the validate command."""
+    from ..validation import validate_environment
+
+    if not validate_environment(Path(args.path)):
+        print("❌ Issues found with Super CC environment.")
+        return 1
+
+    print("🫧 Super CC environment is valid and ready to use.")
+    return 0
@@ -0,0 +1,58 @@
+"""super-cc watch: re-summarize changed files in the background."""
+
+import argparse
+from pathlib import Path
+
+from . import add_path_argument, add_shared_dir_argument
+
+
+def add_arguments(parser: argparse.ArgumentParser) -> None:
+    """Configure arguments for the watch command."""
+    from ..watch import DEFAULT_COMMAND
+
+    add_path_argument(parser)
+    parser.add_argument(
+        "--command",
+        dest="summarizer",
+        metavar="CMD",
+        default=DEFAULT_COMMAND,
+        help="Summarizer command; {files} expands to the changed paths "
+             f"(default: {DEFAULT_COMMAND})"
+    )
+    add_shared_dir_argument(parser)
+    parser.add_argument(
+        "--debounce",
+        type=float,
+        default=0.5,
+        help="Seconds of quiet before a burst of saves is processed (default: 0.5)"
+    )
+    parser.add_argument(
+        "--poll",
+        action="store_true",
+        help="Poll with scandir instead of using inotify"
+    )
+    parser.add_argument(
+        "--interval",
+        type=float,
+        default=2.0,
+        help="Seconds between scans when polling (default: 2.0)"
+    )
+
+
+def run(args: argparse.Namespace) -> int:
+    """Run the watch command."""
+    from ..watch import watch
+
+    print(f"🧼 Watching {Path(args.path).resolve()} (Ctrl-C to stop)")
+    try:
+        watch(
+            Path(args.path),
+            command=args.summarizer,
+            debounce=args.debounce,
+            poll_interval=args.interval,
+            force_poll=args.poll,
+            shared_dir=args.shared_dir,
+        )
+    except KeyboardInterrupt:
+        print("\n🫧 Watch stopped.")
+    return 0
@@ -0,0 +1,377 @@
+"""
+Super CC Context Index
+
+Maintains an inverted index over the per-file JSON summaries written by
+context synthesis, so agents can ask for the few summaries relevant to a
+question instead of loading the whole digest.
+
+The index lives in .claude/cache/summary-index.json and is refreshed
+incrementally: only summary files whose size or mtime changed are re-read.
+"""
+
+import heapq
+import json
+import math
+import os
+import re
+from bisect import bisect_left
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Optional, Set, Tuple
+
+from .fsutil import write_json
+from .profiling import timed
+
+INDEX_VERSION = 2
+
+# Summary field -> weight of a term occurrence in that field
+FIELD_WEIGHTS = {
+    "main_roles": 3.0,
+    "apis": 2.0,
+    "cross_cutting": 1.5,
+    "todos": 1.0,
+    "path": 1.0,
+}
+
+STOPWORDS = frozenset(
+    "a an and are as at be by do does file files for from how in is it of on or "
+    "that the this to what where which who with".split()
+)
+
+# BM25 parameters
+K1 = 1.2
+B = 0.75
+
+# Query terms also match longer index terms they prefix, and shorter index
+# terms that prefix them ("authentication" finds "auth"), at a discount
+PREFIX_MIN_LENGTH = 3
+STEM_MIN_LENGTH = 4
+PREFIX_WEIGHT = 0.5
+
+# Files context synthesis summarizes; docs, data, lockfiles and assets are skipped
+SOURCE_SUFFIXES = frozenset({
+    ".py", ".pyi", ".js", ".jsx", ".mjs", ".cjs", ".ts", ".tsx", ".vue", ".svelte",
+    ".go", ".rs", ".java", ".kt", ".kts", ".scala", ".groovy", ".rb", ".php", ".cs",
+    ".c", ".h", ".cc", ".cpp", ".cxx", ".hh", ".hpp", ".m", ".mm", ".swift", ".dart",
+    ".ex", ".exs", ".erl", ".hs", ".clj", ".lua", ".r", ".jl", ".sh", ".bash", ".sql",
+})
+
+_SPLIT_RE = re.compile(r"[^A-Za-z0-9]+")
+_CAMEL_RE = re.compile(r"(?<=[a-z0-9])(?=[A-Z])")
+
+
+class SearchResult(NamedTuple):
+    """A ranked summary match."""
+
+    path: str
+    score: float
+    source: str
+
+
+def tokenize(text: str) -> Iterator[str]:
+    """Split text into normalized terms.
+
+    Splits on punctuation, snake_case and camelCase boundaries, lowercases,
+    drops stopwords and strips plural suffixes.
+    """
+    for chunk in _SPLIT_RE.split(text):
+        for word in _CAMEL_RE.split(chunk):
+            word = word.lower()
+            if len(word) < 2 or word in STOPWORDS:
+                continue
+            yield _stem(word)
+
+
+def is_summarizable(rel_path: str) -> bool:
+    """Check whether context synthesis would summarize a file."""
+    return os.path.splitext(rel_path)[1].lower() in SOURCE_SUFFIXES
+
+
+def _stem(word: str) -> str:
+    """Strip plural suffixes so "tokens" and "token" index together."""
+    if len(word) > 4 and word.endswith("ies"):
+        return word[:-3] + "y"
+    if len(word) > 3 and word.endswith("s") and not word.endswith("ss"):
+        return word[:-1]
+    return word
+
+
+class SummaryIndex:
+    """Inverted index over .claude/context/summaries/*_summary.json."""
+
+    def __init__(self, repo_path: Path):
+        """Initialize index for repository.
+
+        Args:
+            repo_path: Path to the repository
+        """
+        self.repo_path = Path(repo_path)
+        self.summaries_dir = self.repo_path / ".claude" / "context" / "summaries"
+        self.index_path = self.repo_path / ".claude" / "cache" / "summary-index.json"
+        self._sources: Dict[str, Dict] = {}
+        self._docs: Dict[str, Dict] = {}
+        self._postings: Dict[str, Dict[str, float]] = {}
+        self._sorted_terms: Optional[List[str]] = None
+        self._loaded = False
+
+    @timed("context.refresh")
+    def refresh(self) -> Tuple[int, int]:
+        """Bring the index up to date with the summaries directory.
+
+        Returns:
+            Tuple of (summary files re-indexed, summary files removed)
+        """
+        self._load()
+        if not self.summaries_dir.is_dir() and not self._sources:
+            # Nothing synthesized yet; don't create an index in an uninitialized repo
+            return 0, 0
+
+        seen = set()
+        updated = 0
+        if self.summaries_dir.is_dir():
+            with os.scandir(self.summaries_dir) as entries:
+                for entry in entries:
+                    if not entry.name.endswith("_summary.json") or not entry.is_file():
+                        continue
+                    seen.add(entry.name)
+                    stat = entry.stat()
+                    known = self._sources.get(entry.name)
+                    if known and known["mtime_ns"] == stat.st_mtime_ns and known["size"] == stat.st_size:
+                        continue
+                    self._reindex_source(entry.name, Path(entry.path), stat)
+                    updated += 1
+
+        removed = [name for name in self._sources if name not in seen]
+        for name in removed:
+            self._drop_source(name)
+
+        if updated or removed or not self.index_path.exists():
+            self._save()
+        return updated, len(removed)
+
+    @timed("context.query")
+    def query(self, text: str, limit: int = 10) -> List[SearchResult]:
+        """Rank summaries against a free-text query.
+
+        Args:
+            text: Query such as "which files implement authentication"
+            limit: Maximum number of results
+
+        Returns:
+            Results ordered by descending score
+        """
+        self._load()
+        if not self._docs:
+            return []
+
+        doc_count = len(self._docs)
+        avg_length = sum(doc["length"] for doc in self._docs.values()) / doc_count or 1.0
+        scores: Dict[str, float] = {}
+
+        for term in set(tokenize(text)):
+            for index_term, weight in self._expand(term):
+                postings = self._postings[index_term]
+                idf = math.log(1 + (doc_count - len(postings) + 0.5) / (len(postings) + 0.5))
+                for path, tf in postings.items():
+                    norm = K1 * (1 - B + B * self._docs[path]["length"] / avg_length)
+                    scores[path] = scores.get(path, 0.0) + weight * idf * tf * (K1 + 1) / (tf + norm)
+
+        best = heapq.nlargest(limit, scores.items(), key=lambda item: item[1])
+        return [SearchResult(path, score, self._docs[path]["source"]) for path, score in best]
+
+    def paths(self) -> List[str]:
+        """Return the file paths that have an indexed summary."""
+        self._load()
+        return sorted(self._docs)
+
+    def entries(self, paths: Optional[Iterable[str]] = None) -> Iterator[Tuple[str, Dict, Path]]:
+        """Iterate indexed summary entries.
+
+        Re-reads summary files, so call refresh() first for current results.
+
+        Args:
+            paths: Only read the summary files holding these paths (default: all)
+
+        Yields:
+            Tuples of (file path, summary entry, summary file it came from)
+        """
+        self._load()
+        wanted = None if paths is None else set(paths)
+        if wanted is None:
+            names = sorted(self._sources)
+        else:
+            names = sorted({self._docs[p]["source"] for p in wanted if p in self._docs})
+        for name in names:
+            source = self.summaries_dir / name
+            try:
+                data = json.loads(source.read_text())
+            except (OSError, ValueError):
+                continue
+            for entry in _summary_entries(data, name):
+                if wanted is None or entry["path"] in wanted:
+                    yield entry["path"], entry, source
+
+    def forget(self, paths: Iterable[str]) -> int:
+        """Delete the summaries of files or directories that no longer exist.
+
+        Single-file summaries are removed; digests are rewritten without the
+        entries. The index is refreshed first so summaries written since the
+        last refresh are found; call refresh() afterwards to drop the entries.
+
+        Args:
+            paths: Repo-relative paths of deleted files or directories
+
+        Returns:
+            Number of summary entries removed
+        """
+        self.refresh()
+        prefixes = tuple(p.rstrip("/") + "/" for p in paths)
+        doomed = [p for p in self._docs if p.startswith(prefixes) or p + "/" in prefixes]
+        by_source: Dict[str, Set[str]] = {}
+        for doc_path in doomed:
+            by_source.setdefault(self._docs[doc_path]["source"], set()).add(doc_path)
+
+        removed = 0
+        for name, doc_paths in by_source.items():
+            source = self.summaries_dir / name
+            try:
+                data = json.loads(source.read_text())
+            except (OSError, ValueError):
+                continue
+            files = data.get("files") if isinstance(data, dict) else None
+            try:
+                if isinstance(files, list):
+                    kept = [e for e in files if not (isinstance(e, dict) and e.get("path") in doc_paths)]
+                    removed += len(files) - len(kept)
+                    write_json(source, dict(data, files=kept))
+                else:
+                    source.unlink()
+                    removed += 1
+            except OSError as e:
+                print(f"⚠️  Warning: Could not remove stale summary {name}: {e}")
+        return removed
+
+    def _expand(self, term: str) -> Iterable[Tuple[str, float]]:
+        """Yield index terms matching a query term with their weights."""
+        if term in self._postings:
+            yield term, 1.0
+        if len(term) < PREFIX_MIN_LENGTH:
+            return
+        if self._sorted_terms is None:
+            self._sorted_terms = sorted(self._postings)
+        terms = self._sorted_terms
+        position = bisect_left(terms, term)
+        while position < len(terms) and terms[position].startswith(term):
+            if terms[position] != term:
+                yield terms[position], PREFIX_WEIGHT
+            position += 1
+        for length in range(STEM_MIN_LENGTH, len(term)):
+            if term[:length] in self._postings:
+                yield term[:length], PREFIX_WEIGHT
+
+    def _reindex_source(self, name: str, path: Path, stat: os.stat_result) -> None:
+        """Replace the documents contributed by one summary file."""
+        self._drop_source(name)
+        try:
+            data = json.loads(path.read_text())
+        except (OSError, ValueError) as e:
+            print(f"⚠️  Skipping unreadable summary {name}: {e}")
+            data = {}
+
+        docs = []
+        for entry in _summary_entries(data, name):
+            terms: Dict[str, float] = {}
+            for field, weight in FIELD_WEIGHTS.items():
+                for value in _field_values(entry.get(field)):
+                    for term in tokenize(value):
+                        terms[term] = terms.get(term, 0.0) + weight
+            doc_path = entry["path"]
+            self._drop_doc(doc_path)
+            self._docs[doc_path] = {"source": name, "length": sum(terms.values()), "terms": terms}
+            for term, tf in terms.items():
+                self._postings.setdefault(term, {})[doc_path] = tf
+            docs.append(doc_path)
+
+        self._sources[name] = {"mtime_ns": stat.st_mtime_ns, "size": stat.st_size, "docs": docs}
+        self._sorted_terms = None
+
+    def _drop_source(self, name: str) -> None:
+        """Remove every document contributed by a summary file."""
+        source = self._sources.pop(name, None)
+        if source is None:
+            return
+        for doc_path in source["docs"]:
+            if self._docs.get(doc_path, {}).get("source") == name:
+                self._drop_doc(doc_path)
+        self._sorted_terms = None
+
+    def _drop_doc(self, doc_path: str) -> None:
+        """Remove one document from the postings."""
+        doc = self._docs.pop(doc_path, None)
+        if doc is None:
+            return
+        for term in doc["terms"]:
+            postings = self._postings.get(term)
+            if postings is not None:
+                postings.pop(doc_path, None)
+                if not postings:
+                    del self._postings[term]
+
+    def _load(self) -> None:
+        """Load the persisted index once, starting empty if it is missing or stale."""
+        if self._loaded:
+            return
+        self._loaded = True
+        try:
+            data = json.loads(self.index_path.read_text())
+        except (OSError, ValueError):
+            return
+        if data.get("version") != INDEX_VERSION:
+            return
+        self._sources = data["sources"]
+        self._docs = data["docs"]
+        self._postings = data["postings"]
+
+    def _save(self) -> None:
+        """Persist the index atomically."""
+        payload = {
+            "version": INDEX_VERSION,
+            "sources": self._sources,
+            "docs": self._docs,
+            "postings": self._postings,
+        }
+        write_json(self.index_path, payload, compact=True)
+
+
+def _summary_entries(data: object, source: str) -> Iterator[Dict]:
+    """Yield per-file summary entries from a summary document.
+
+    Accepts both a single-file summary and a digest with a "files" list.
+    A digest's top-level ``cross_cutting`` concerns are merged into each of
+    its entries. Entries without a path are keyed by their summary file name.
+    """
+    if not isinstance(data, dict):
+        return
+    files = data.get("files")
+    entries = files if isinstance(files, list) else [data]
+    shared = list(_field_values(data.get("cross_cutting"))) if entries is files else []
+    for entry in entries:
+        if not isinstance(entry, dict):
+            continue
+        if shared:
+            own = list(_field_values(entry.get("cross_cutting")))
+            entry = dict(entry, cross_cutting=own + [c for c in shared if c not in own])
+        if not isinstance(entry.get("path"), str):
+            entry = dict(entry, path=source[: -len("_summary.json")])
+        yield entry
+
+
+def _field_values(value: object) -> Iterator[str]:
+    """Flatten a summary field into strings."""
+    if isinstance(value, str):
+        yield value
+    elif isinstance(value, list):
+        for item in value:
+            if isinstance(item, str):
+                yield item
+            elif isinstance(item, dict):
+                yield from (v for v in item.values() if isinstance(v, str))
@@ -0,0 +1,197 @@
+"""
+Super CC Ecosystem Detection
+
+Finds every project root in a repository, including the sub-projects of a
+monorepo, in a single os.scandir pass that prunes ignored and vendored
+directories. Results are cached in .claude/state/projects.json keyed by the
+git tree hash of HEAD plus the size and mtime of the marker files found, so
+repeat calls cost a ``git rev-parse`` and one stat per marker.
+"""
+
+import json
+import os
+import subprocess
+from pathlib import Path
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+from .fsutil import write_json
+from .gitignore import GitignoreMatcher, walk
+from .profiling import timed
+
+CACHE_VERSION = 2
+
+# Marker file -> ecosystem
+MARKERS = {
+    "package.json": "node",
+    "pyproject.toml": "python",
+    "requirements.txt": "python",
+    "setup.py": "python",
+    "Cargo.toml": "rust",
+    "go.mod": "go",
+}
+
+# Pruned even when not ignored: dependency caches and build output
+VENDORED_DIRS = frozenset({
+    ".git", ".hg", ".svn", ".claude", "node_modules", "bower_components",
+    "vendor", "third_party", ".venv", "venv", "__pycache__", ".tox", ".nox",
+    ".mypy_cache", ".pytest_cache", "target", "dist", "build", ".next",
+})
+
+# Ecosystem -> tool suggestion shown after install
+SUGGESTIONS = {
+    "node": "Node.js detected - Consider: npm install --save-dev vitest eslint prettier typescript",
+    "python": "Python detected - Consider: pip install pytest black ruff mypy",
+    "rust": "Rust detected - Consider: cargo install cargo-watch",
+    "go": "Go detected - Built-in tools available: go test, go fmt",
+}
+
+
+# (mtime_ns, size) of a marker file
+Stamp = Tuple[int, int]
+
+
+class Project(NamedTuple):
+    """A project root and the ecosystems whose markers it contains."""
+
+    root: str
+    ecosystems: Tuple[str, ...]
+
+
+class EcosystemDetector:
+    """Detects project roots and their ecosystems."""
+
+    def __init__(self, repo_path: Path):
+        """Initialize detector for repository.
+
+        Args:
+            repo_path: Path to the repository
+        """
+        self.repo_path = Path(repo_path)
+        self.cache_path = self.repo_path / ".claude" / "state" / "projects.json"
+
+    @timed("ecosystems.detect")
+    def detect(self, use_cache: bool = True) -> List[Project]:
+        """Find all project roots.
+
+        Args:
+            use_cache: Reuse cached results while HEAD's tree and the
+                previously found marker files are unchanged. Markers added
+                without a commit are picked up once HEAD moves, or by
+                passing False.
+
+        Returns:
+            Projects sorted by root path ("" is the repository root)
+        """
+        tree = self._cache_key() if use_cache else None
+        if tree is not None:
+            cached = self._read_cache(tree)
+            if cached is not None:
+                return cached
+
+        projects, markers = self._scan()
+        if tree is not None:
+            self._write_cache(tree, projects, markers)
+        return projects
+
+    def _scan(self) -> Tuple[List[Project], Dict[str, Stamp]]:
+        """Walk the tree once, recording directories that contain markers.
+
+        Returns:
+            Tuple of (projects, stamp of every marker file found)
+        """
+        projects = []
+        markers: Dict[str, Stamp] = {}
+        for rel_dir, _, files in walk(GitignoreMatcher(self.repo_path), skip=VENDORED_DIRS):
+            found = set()
+            for entry in files:
+                if entry.name in MARKERS:
+                    found.add(MARKERS[entry.name])
+                    rel_path = f"{rel_dir}/{entry.name}" if rel_dir else entry.name
+                    markers[rel_path] = _stamp(entry.stat())
+            if found:
+                projects.append(Project(rel_dir, tuple(sorted(found))))
+        return sorted(projects), markers
+
+    def _cache_key(self) -> Optional[str]:
+        """Key the cache on HEAD's tree.
+
+        Returns:
+            The tree hash, or None outside a git checkout
+        """
+        return self._git("rev-parse", "HEAD^{tree}") or None
+
+    def _git(self, *args: str) -> Optional[str]:
+        """Run a git command, returning its stripped output or None on failure."""
+        try:
+            result = subprocess.run(
+                ["git", *args],
+                cwd=self.repo_path,
+                capture_output=True,
+                text=True,
+                timeout=10,
+            )
+        except (OSError, subprocess.TimeoutExpired):
+            return None
+        if result.returncode != 0:
+            return None
+        return result.stdout.strip()
+
+    def _read_cache(self, tree: str) -> Optional[List[Project]]:
+        try:
+            data = json.loads(self.cache_path.read_text())
+        except (OSError, ValueError):
+            return None
+        if data.get("version") != CACHE_VERSION or data.get("tree") != tree:
+            return None
+        # Edited or removed markers change the projects before a commit
+        for rel_path, stamp in data["markers"].items():
+            try:
+                if _stamp(os.stat(self.repo_path / rel_path)) != tuple(stamp):
+                    return None
+            except OSError:
+                return None
+        return [Project(p["root"], tuple(p["ecosystems"])) for p in data["projects"]]
+
+    def _write_cache(self, tree: str, projects: List[Project], markers: Dict[str, Stamp]) -> None:
+        payload = {
+            "version": CACHE_VERSION,
+            "tree": tree,
+            "markers": markers,
+            "projects": [{"root": p.root, "ecosystems": list(p.ecosystems)} for p in projects],
+        }
+        try:
+            write_json(self.cache_path, payload)
+        except OSError as e:
+            print(f"⚠️  Warning: Could not cache project list: {e}")
+
+
+def _stamp(stat: os.stat_result) -> Stamp:
+    """Identify a file version by modification time and size."""
+    return stat.st_mtime_ns, stat.st_size
+
+
+def project_for(projects: List[Project], rel_path: str) -> Optional[Project]:
+    """Find the innermost project containing a path.
+
+    Args:
+        projects: Projects from EcosystemDetector.detect()
+        rel_path: Repo-relative file or directory path
+
+    Returns:
+        The deepest enclosing project, or None if no project contains it
+    """
+    best = None
+    for project in projects:
+        if project.root == "" or rel_path == project.root or rel_path.startswith(project.root + "/"):
+            if best is None or len(project.root) > len(best.root):
+                best = project
+    return best
+
+
+def group_by_ecosystem(projects: List[Project]) -> Dict[str, List[str]]:
+    """Map each ecosystem to the roots of projects using it."""
+    grouped: Dict[str, List[str]] = {}
+    for project in projects:
+        for ecosystem in project.ecosystems:
+            grouped.setdefault(ecosystem, []).append(project.root or ".")
+    return grouped
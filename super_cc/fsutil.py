@@ -0,0 +1,36 @@
+"""
+Super CC File Utilities
+
+Atomic writes for the JSON state, index and cache files that several
+processes (watchers, CI jobs, other clones) may read or write concurrently.
+"""
+
+import contextlib
+import json
+import os
+from pathlib import Path
+
+
+def write_json(path: Path, data: object, compact: bool = False) -> None:
+    """Write JSON so readers see either the previous file or the complete new one.
+
+    The data goes to a uniquely named temporary file in the destination
+    directory, which is then renamed over the target. Concurrent writers never
+    share a temporary file, and the last rename wins.
+
+    Args:
+        path: Destination file; parent directories are created as needed
+        data: JSON-serializable data
+        compact: Write without indentation or spaces
+    """
+    path = Path(path)
+    text = json.dumps(data, separators=(",", ":")) if compact else json.dumps(data, indent=2)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.{os.urandom(6).hex()}.tmp")
+    try:
+        tmp_path.write_text(text)
+        os.replace(tmp_path, path)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            tmp_path.unlink()
+        raise
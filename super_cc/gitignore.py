@@ -0,0 +1,381 @@
+"""
+Super CC Gitignore Matching
+
+Evaluates gitignore patterns the way git does, so callers can ask whether a
+path is already ignored instead of comparing raw .gitignore lines.
+"""
+
+import os
+import re
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Pattern, Tuple
+
+GLOB_CHARS = frozenset("*?[\\")
+
+# POSIX bracket classes supported by git's wildmatch, as regex class members
+POSIX_CLASSES = {
+    "alnum": "a-zA-Z0-9",
+    "alpha": "a-zA-Z",
+    "blank": " \\t",
+    "cntrl": "\\x00-\\x1f\\x7f",
+    "digit": "0-9",
+    "graph": "!-~",
+    "lower": "a-z",
+    "print": " -~",
+    "punct": "!-/:-@\\[-`{-~",
+    "space": " \\t\\n\\r\\f\\v",
+    "upper": "A-Z",
+    "xdigit": "0-9A-Fa-f",
+}
+
+
+class _Rule:
+    """A single parsed gitignore pattern."""
+
+    __slots__ = ("index", "negated", "dir_only", "anchored", "body")
+
+    def __init__(self, index: int, body: str, negated: bool, dir_only: bool, anchored: bool):
+        self.index = index
+        self.body = body
+        self.negated = negated
+        self.dir_only = dir_only
+        self.anchored = anchored
+
+
+class _RuleSet:
+    """Rules from one ignore file, indexed for fast lookup.
+
+    Like git, literal rules and the common ``*.ext`` and ``prefix*`` forms are
+    answered from hash tables. The remaining globs are compiled lazily into one
+    alternation per kind of lookup, ordered so the first alternative matching
+    is the last rule in the file.
+    """
+
+    def __init__(self, base: str, lines: List[str]):
+        """Parse ignore file lines.
+
+        Args:
+            base: Directory of the ignore file relative to the repo ("" for root)
+            lines: Raw lines of the ignore file
+        """
+        self.base = base
+        self.literal_paths: Dict[str, List[_Rule]] = {}
+        self.literal_names: Dict[str, List[_Rule]] = {}
+        self.suffixes: Dict[str, List[_Rule]] = {}
+        self.prefixes: Dict[str, List[_Rule]] = {}
+        self.globs: List[_Rule] = []
+        self._combined: Dict[Tuple[bool, bool], Optional[Tuple[Pattern[str], Dict[str, _Rule]]]] = {}
+
+        for index, line in enumerate(lines):
+            rule = _parse_line(index, line)
+            if rule is None:
+                continue
+            body = rule.body
+            if GLOB_CHARS.isdisjoint(body):
+                table = self.literal_paths if rule.anchored else self.literal_names
+                table.setdefault(body, []).append(rule)
+            elif not rule.anchored and body[0] == "*" and GLOB_CHARS.isdisjoint(body[1:]):
+                self.suffixes.setdefault(body[1:], []).append(rule)
+            elif not rule.anchored and body[-1] == "*" and GLOB_CHARS.isdisjoint(body[:-1]):
+                self.prefixes.setdefault(body[:-1], []).append(rule)
+            else:
+                self.globs.append(rule)
+        self._has_affixes = bool(self.suffixes or self.prefixes)
+
+    def match(self, rel_path: str, is_dir: bool) -> Optional[bool]:
+        """Find the last rule matching a path.
+
+        Args:
+            rel_path: Path relative to the repo root, using forward slashes
+            is_dir: Whether the path is a directory
+
+        Returns:
+            True if ignored, False if re-included by a negation, None if no rule matches
+        """
+        if self.base:
+            if not rel_path.startswith(self.base + "/"):
+                return None
+            rel_path = rel_path[len(self.base) + 1:]
+        name = rel_path.rsplit("/", 1)[-1]
+
+        best = _last(self.literal_paths.get(rel_path), is_dir, None)
+        best = _last(self.literal_names.get(name), is_dir, best)
+        if self._has_affixes:
+            for cut in range(len(name) + 1):
+                best = _last(self.suffixes.get(name[cut:]), is_dir, best)
+                best = _last(self.prefixes.get(name[:cut]), is_dir, best)
+        if self.globs:
+            for anchored, subject in ((True, rel_path), (False, name)):
+                rule = self._match_globs(subject, anchored, is_dir)
+                if rule is not None and (best is None or rule.index > best.index):
+                    best = rule
+
+        if best is None:
+            return None
+        return not best.negated
+
+    def _match_globs(self, subject: str, anchored: bool, is_dir: bool) -> Optional[_Rule]:
+        """Return the last glob rule of one kind matching ``subject``."""
+        key = (anchored, is_dir)
+        if key not in self._combined:
+            # Compiled on first use: most ignore files never need every kind
+            rules = [r for r in self.globs if r.anchored == anchored and (is_dir or not r.dir_only)]
+            if rules:
+                rules.sort(key=lambda r: r.index, reverse=True)
+                regex = re.compile("|".join(f"(?P<r{r.index}>{_translate(r.body)})" for r in rules))
+                self._combined[key] = (regex, {f"r{r.index}": r for r in rules})
+            else:
+                self._combined[key] = None
+        combined = self._combined[key]
+        if combined is None:
+            return None
+        match = combined[0].fullmatch(subject)
+        return combined[1][match.lastgroup] if match is not None and match.lastgroup else None
+
+
+def _last(rules: Optional[List[_Rule]], is_dir: bool, best: Optional[_Rule]) -> Optional[_Rule]:
+    """Pick the later of ``best`` and the last applicable rule in ``rules``."""
+    if rules:
+        for rule in rules:
+            if (is_dir or not rule.dir_only) and (best is None or rule.index > best.index):
+                best = rule
+    return best
+
+
+class GitignoreMatcher:
+    """Answers whether repository paths are ignored by git.
+
+    Honors nested .gitignore files and .git/info/exclude with git's
+    precedence: deeper .gitignore files override shallower ones, which
+    override the exclude file. Ignore files are loaded lazily per directory.
+    """
+
+    def __init__(self, repo_path: Path, extra_patterns: Iterable[str] = ()):
+        """Initialize matcher for repository.
+
+        Args:
+            repo_path: Path to the repository root
+            extra_patterns: Additional root-level patterns, evaluated with the
+                same (lowest) precedence as .git/info/exclude
+        """
+        self.repo_path = Path(repo_path)
+        self._rule_sets: Dict[str, Optional[_RuleSet]] = {}
+        self._dir_cache: Dict[str, bool] = {}
+        self._exclude = self._load(self.repo_path / ".git" / "info" / "exclude", "")
+        self._extra = _RuleSet("", list(extra_patterns)) if extra_patterns else None
+
+    def is_ignored(self, rel_path: str, is_dir: bool = False) -> bool:
+        """Check whether a path is ignored.
+
+        A path is ignored if it matches directly or if any parent directory
+        is ignored, since git never descends into excluded directories.
+
+        Args:
+            rel_path: Path relative to the repo root
+            is_dir: Whether the path is a directory
+
+        Returns:
+            True if git would ignore the path, False otherwise
+        """
+        rel_path = rel_path.replace(os.sep, "/").strip("/")
+        if not rel_path:
+            return False
+        parts = rel_path.split("/")
+        for depth in range(1, len(parts)):
+            if self._is_dir_ignored("/".join(parts[:depth])):
+                return True
+        if is_dir:
+            return self._is_dir_ignored(rel_path)
+        return self._match(rel_path, False)
+
+    def _is_dir_ignored(self, rel_dir: str) -> bool:
+        """Check a directory on its own, caching the result."""
+        cached = self._dir_cache.get(rel_dir)
+        if cached is None:
+            cached = self._dir_cache[rel_dir] = self._match(rel_dir, True)
+        return cached
+
+    def _match(self, rel_path: str, is_dir: bool) -> bool:
+        """Evaluate ignore files from the deepest directory up to the exclude file."""
+        parent = rel_path.rsplit("/", 1)[0] if "/" in rel_path else ""
+        while True:
+            rule_set = self._rules_for(parent)
+            if rule_set is not None:
+                result = rule_set.match(rel_path, is_dir)
+                if result is not None:
+                    return result
+            if not parent:
+                break
+            parent = parent.rsplit("/", 1)[0] if "/" in parent else ""
+
+        for rule_set in (self._exclude, self._extra):
+            if rule_set is not None:
+                result = rule_set.match(rel_path, is_dir)
+                if result is not None:
+                    return result
+        return False
+
+    def _rules_for(self, rel_dir: str) -> Optional[_RuleSet]:
+        """Return the parsed .gitignore of a directory, loading it once."""
+        if rel_dir not in self._rule_sets:
+            self._rule_sets[rel_dir] = self._load(self.repo_path / rel_dir / ".gitignore", rel_dir)
+        return self._rule_sets[rel_dir]
+
+    @staticmethod
+    def _load(path: Path, base: str) -> Optional[_RuleSet]:
+        """Parse an ignore file, returning None if it is missing or unreadable."""
+        try:
+            with open(path, encoding="utf-8", errors="replace") as f:
+                return _RuleSet(base, f.read().splitlines())
+        except OSError:
+            return None
+
+
+def walk(
+    matcher: GitignoreMatcher, root: str = "", skip: Iterable[str] = (".git",)
+) -> Iterator[Tuple[str, List[os.DirEntry], List[os.DirEntry]]]:
+    """Walk a repository with os.scandir, pruning ignored paths.
+
+    Ignored directories are never entered, so vendored or generated trees
+    cost one stat each. Symlinks are reported as files and never followed.
+
+    Args:
+        matcher: Matcher for the repository to walk
+        root: Repo-relative directory to start from ("" for the whole repo)
+        skip: Directory names to prune at any depth
+
+    Yields:
+        Tuples of (relative directory, unignored subdirectories, unignored files)
+    """
+    skip = frozenset(skip)
+    stack = [root.strip("/")]
+    while stack:
+        rel_dir = stack.pop()
+        dirs: List[os.DirEntry] = []
+        files: List[os.DirEntry] = []
+        try:
+            with os.scandir(matcher.repo_path / rel_dir) as entries:
+                for entry in entries:
+                    rel_path = f"{rel_dir}/{entry.name}" if rel_dir else entry.name
+                    try:
+                        is_dir = entry.is_dir(follow_symlinks=False)
+                    except OSError:
+                        continue
+                    if is_dir and entry.name in skip:
+                        continue
+                    if matcher.is_ignored(rel_path, is_dir=is_dir):
+                        continue
+                    (dirs if is_dir else files).append(entry)
+        except OSError:
+            continue
+        yield rel_dir, dirs, files
+        stack.extend(f"{rel_dir}/{d.name}" if rel_dir else d.name for d in reversed(dirs))
+
+
+def _parse_line(index: int, line: str) -> Optional[_Rule]:
+    """Parse one gitignore line into a rule, or None for blanks and comments."""
+    if not line or line.startswith("#"):
+        return None
+
+    # Trailing spaces are dropped unless escaped with a backslash
+    stripped = line.rstrip(" ")
+    if stripped.endswith("\\") and len(stripped) < len(line):
+        stripped += " "
+    line = stripped
+    if not line:
+        return None
+
+    negated = line.startswith("!")
+    if negated:
+        line = line[1:]
+    elif line.startswith("\\!") or line.startswith("\\#"):
+        line = line[1:]
+
+    dir_only = line.endswith("/")
+    line = line.rstrip("/")
+    if not line:
+        return None
+
+    anchored = "/" in line
+    return _Rule(index, line.lstrip("/"), negated, dir_only, anchored)
+
+
+def _translate(pattern: str) -> str:
+    """Translate a gitignore glob into a regular expression.
+
+    Follows git's wildmatch rules: ``*`` and ``?`` never cross ``/``, while
+    ``**`` spans directories when it forms a whole path component.
+    """
+    out: List[str] = []
+    i, n = 0, len(pattern)
+    while i < n:
+        c = pattern[i]
+        if c == "*":
+            if pattern.startswith("**", i):
+                at_start = i == 0 or pattern[i - 1] == "/"
+                if at_start and pattern.startswith("**/", i):
+                    out.append("(?:.*/)?")
+                    i += 3
+                    continue
+                if at_start and i + 2 == n:
+                    out.append(".*")
+                    i += 2
+                    continue
+                i += 1
+            out.append("[^/]*")
+        elif c == "?":
+            out.append("[^/]")
+        elif c == "[":
+            end, cls = _translate_class(pattern, i)
+            if cls is None:
+                out.append(re.escape(c))
+            else:
+                out.append(cls)
+                i = end
+                continue
+        elif c == "\\" and i + 1 < n:
+            i += 1
+            out.append(re.escape(pattern[i]))
+        else:
+            out.append(re.escape(c))
+        i += 1
+    return "".join(out)
+
+
+def _translate_class(pattern: str, start: int) -> Tuple[int, Optional[str]]:
+    """Translate a bracket expression starting at ``start``.
+
+    Returns:
+        Index just past the closing bracket and the regex class, or
+        (start, None) if the bracket is unterminated
+    """
+    i = start + 1
+    negate = i < len(pattern) and pattern[i] in "!^"
+    if negate:
+        i += 1
+    members: List[str] = []
+    first = True
+    while i < len(pattern):
+        c = pattern[i]
+        if c == "]" and not first:
+            body = "".join(members)
+            # Bracket expressions never match "/", whatever their members
+            return i + 1, f"[^/{body}]" if negate else f"(?!/)[{body}]"
+        if c == "[" and pattern.startswith("[:", i):
+            close = pattern.find(":]", i + 2)
+            posix = POSIX_CLASSES.get(pattern[i + 2:close]) if close != -1 else None
+            if posix is not None:
+                members.append(posix)
+                first = False
+                i = close + 2
+                continue
+        if c == "\\" and i + 1 < len(pattern):
+            i += 1
+            c = pattern[i]
+        if c == "-" and members and i + 1 < len(pattern) and pattern[i + 1] != "]":
+            members.append("-")
+        else:
+            members.append(re.escape(c))
+        first = False
+        i += 1
+    return start, None
@@ -7,12 +7,13 @@ with backup, merge, and conflict resolution capabilities.
 
 import os
 import shutil
-import subprocess
 from datetime import datetime
 from pathlib import Path
 from typing import Optional
 
+from .ecosystems import SUGGESTIONS, EcosystemDetector, group_by_ecosystem
 from .integration import GitignoreManager, ClaudeDirectoryManager
+from .profiling import timed
 
 
 class SuperCCInstaller:
@@ -28,6 +29,7 @@ class SuperCCInstaller:
         self.claude_dir = self.target_path / ".claude"
         self.templates_dir = Path(__file__).parent / "templates" / ".claude"
         
+    @timed("install")
     def install(self, force: bool = False, backup: bool = True) -> bool:
         """Install Super CC environment.
         
@@ -84,6 +86,7 @@ class SuperCCInstaller:
             print(f"❌ Installation failed: {e}")
             return False
     
+    @timed("upgrade")
     def upgrade(self) -> bool:
         """Upgrade existing Super CC environment to latest version.
         
@@ -117,6 +120,7 @@ class SuperCCInstaller:
             print(f"❌ Upgrade failed: {e}")
             return False
     
+    @timed("backup")
     def _create_backup(self) -> bool:
         """Create timestamped backup of existing .claude directory.
         
@@ -137,6 +141,7 @@ class SuperCCInstaller:
             print(f"❌ Backup failed: {e}")
             return False
     
+    @timed("template_copy")
     def _install_template_files(self) -> bool:
         """Install template files from package.
         
@@ -161,6 +166,7 @@ class SuperCCInstaller:
             print(f"❌ Failed to install template files: {e}")
             return False
     
+    @timed("chmod")
     def _make_hooks_executable(self) -> None:
         """Make hook scripts executable."""
         hooks_dir = self.claude_dir / "hooks"
@@ -172,6 +178,7 @@ class SuperCCInstaller:
                 except Exception as e:
                     print(f"⚠️  Warning: Could not make {hook_file.name} executable: {e}")
     
+    @timed("initial_state")
     def _create_initial_state(self) -> None:
         """Create initial state files."""
         state_dir = self.claude_dir / "state"
@@ -188,24 +195,24 @@ class SuperCCInstaller:
         logs_dir.mkdir(exist_ok=True)
         print("🫧 Logs directory ready")
     
+    @timed("tool_suggestion")
     def _suggest_language_tools(self) -> None:
-        """Suggest language-specific tools based on project files."""
-        suggestions = []
-        
-        # Check for different language ecosystems
-        if (self.target_path / "package.json").exists():
-            suggestions.append("Node.js detected - Consider: npm install --save-dev vitest eslint prettier typescript")
-        
-        if (self.target_path / "requirements.txt").exists() or (self.target_path / "pyproject.toml").exists():
-            suggestions.append("Python detected - Consider: pip install pytest black ruff mypy")
+        """Suggest language-specific tools for every detected sub-project."""
+        projects = EcosystemDetector(self.target_path).detect()
+        grouped = group_by_ecosystem(projects)
         
-        if (self.target_path / "Cargo.toml").exists():
-            suggestions.append("Rust detected - Consider: cargo install cargo-watch")
-        
-        if (self.target_path / "go.mod").exists():
-            suggestions.append("Go detected - Built-in tools available: go test, go fmt")
+        suggestions = []
+        for ecosystem, suggestion in SUGGESTIONS.items():
+            roots = grouped.get(ecosystem)
+            if not roots:
+                continue
+            if roots != ["."]:
+                shown = ", ".join(roots[:5]) + (f", +{len(roots) - 5} more" if len(roots) > 5 else "")
+                noun = "project" if len(roots) == 1 else "projects"
+                suggestion += f" ({len(roots)} {noun}: {shown})"
+            suggestions.append(suggestion)
         
         if suggestions:
             print("🫧 Suggested development tools:")
             for suggestion in suggestions:
-                print(f"   {suggestion}")
\ No newline at end of file
+                print(f"   {suggestion}")
@@ -6,9 +6,13 @@ management and .claude directory merging.
 """
 
 import filecmp
+import os
 import shutil
 from pathlib import Path
-from typing import Set
+from typing import Set, Tuple
+
+from .gitignore import GitignoreMatcher
+from .profiling import span, timed
 
 
 class GitignoreManager:
@@ -34,15 +38,19 @@ class GitignoreManager:
         self.repo_path = Path(repo_path)
         self.gitignore_path = self.repo_path / ".gitignore"
     
+    @timed("gitignore")
     def ensure_claude_entries(self) -> bool:
-        """Ensure .gitignore contains Claude Code entries.
+        """Ensure .gitignore covers every Claude Code entry.
+        
+        Entries already ignored by an equivalent pattern (for example
+        ``.claude/`` or ``/.claude/logs``) in any .gitignore or in
+        .git/info/exclude are not added again.
         
         Returns:
             True if successful, False otherwise
         """
         try:
-            existing_entries = self._read_existing_entries()
-            missing_entries = self.CLAUDE_ENTRIES - existing_entries
+            missing_entries = self._find_missing_entries()
             
             if not missing_entries:
                 print(".gitignore already contains all Claude Code entries")
@@ -56,51 +64,64 @@ class GitignoreManager:
             print(f"❌ Failed to update .gitignore: {e}")
             return False
     
-    def _read_existing_entries(self) -> Set[str]:
-        """Read existing .gitignore entries.
+    def _find_missing_entries(self) -> Set[str]:
+        """Find Claude Code entries whose paths git does not already ignore.
         
         Returns:
-            Set of existing entries
+            Set of entries to add
         """
-        if not self.gitignore_path.exists():
-            return set()
+        matcher = GitignoreMatcher(self.repo_path)
+        missing = set()
+        for entry in self.CLAUDE_ENTRIES:
+            if entry.startswith("#"):
+                continue
+            probe, is_dir = self._probe_path(entry)
+            if not matcher.is_ignored(probe, is_dir=is_dir):
+                missing.add(entry)
+        return missing
+    
+    @staticmethod
+    def _probe_path(entry: str) -> Tuple[str, bool]:
+        """Turn an entry into a concrete path that it is meant to ignore.
         
-        try:
-            content = self.gitignore_path.read_text()
-            # Normalize lines (strip whitespace, remove empty lines)
-            lines = {line.strip() for line in content.splitlines() if line.strip()}
-            return lines
-        except Exception:
-            return set()
+        Args:
+            entry: Gitignore entry such as ``.claude/logs/`` or ``.claude/*.log``
+            
+        Returns:
+            Tuple of (relative path, is_dir)
+        """
+        is_dir = entry.endswith("/")
+        return entry.rstrip("/").replace("*", "super-cc"), is_dir
     
     def _append_missing_entries(self, missing_entries: Set[str]) -> None:
         """Append missing entries to .gitignore.
         
+        Uses an O_APPEND write so existing content is never read or rewritten;
+        only the final byte is inspected to decide on a leading newline.
+        
         Args:
             missing_entries: Set of entries to add
         """
-        # Ensure file exists
-        if not self.gitignore_path.exists():
-            self.gitignore_path.write_text("")
-        
-        # Read existing content
-        existing_content = self.gitignore_path.read_text()
-        
-        # Prepare new content
-        if existing_content and not existing_content.endswith('\n'):
-            existing_content += '\n'
+        try:
+            size = self.gitignore_path.stat().st_size
+        except FileNotFoundError:
+            size = 0
         
         # Add separator and comment if file has content
-        if existing_content.strip():
-            new_content = existing_content + '\n# Super CC additions:\n'
+        if size:
+            with open(self.gitignore_path, "rb") as f:
+                f.seek(-1, os.SEEK_END)
+                prefix = "\n" if f.read(1) == b"\n" else "\n\n"
+            block = prefix + "# Super CC additions:\n"
         else:
-            new_content = '# Super CC additions:\n'
+            block = "# Super CC additions:\n"
         
         # Add Claude Code entries
-        new_content += '\n'.join(sorted(missing_entries)) + '\n'
+        block += "\n".join(sorted(missing_entries)) + "\n"
         
-        # Write back
-        self.gitignore_path.write_text(new_content)
+        fd = os.open(self.gitignore_path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        with os.fdopen(fd, "wb") as f:
+            f.write(block.encode("utf-8"))
 
 
 class ClaudeDirectoryManager:
@@ -116,6 +137,7 @@ class ClaudeDirectoryManager:
         self.existing_dir = Path(existing_dir)
         self.template_dir = Path(template_dir)
     
+    @timed("merge")
     def merge_directories(self) -> bool:
         """Merge template directory into existing directory.
         
@@ -128,12 +150,14 @@ class ClaudeDirectoryManager:
             # Process each subdirectory
             for template_subdir in self.template_dir.iterdir():
                 if template_subdir.is_dir():
-                    self._merge_subdirectory(template_subdir)
+                    with span(f"merge.{template_subdir.name}"):
+                        self._merge_subdirectory(template_subdir)
             
             # Process root files
-            for template_file in self.template_dir.iterdir():
-                if template_file.is_file():
-                    self._merge_file(template_file, self.existing_dir / template_file.name)
+            with span("merge.root_files"):
+                for template_file in self.template_dir.iterdir():
+                    if template_file.is_file():
+                        self._merge_file(template_file, self.existing_dir / template_file.name)
             
             print("🫧 Directory merge completed")
             return True
@@ -0,0 +1,210 @@
+"""
+Super CC Profiling
+
+Lightweight timing spans for installer, validator and merge phases. Spans
+cost one attribute check when profiling is disabled, so they can stay in
+place permanently. Enable with ``--profile`` on the CLI to print a per-phase
+breakdown, and ``--profile-trace`` to also write Chrome trace JSON.
+"""
+
+import functools
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple, TypeVar
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+
+class SpanRecord(NamedTuple):
+    """A completed span."""
+
+    name: str
+    start_ns: int
+    duration_ns: int
+    depth: int
+    thread_id: int
+
+
+class _NullSpan:
+    """Shared no-op span returned while profiling is disabled."""
+
+    __slots__ = ()
+
+    def __enter__(self) -> "_NullSpan":
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        return None
+
+
+class _Span:
+    """Context manager recording one timed span."""
+
+    __slots__ = ("_profiler", "_name", "_start", "_depth")
+
+    def __init__(self, profiler: "Profiler", name: str):
+        self._profiler = profiler
+        self._name = name
+        self._start = 0
+        self._depth = 0
+
+    def __enter__(self) -> "_Span":
+        local = self._profiler._local
+        self._depth = getattr(local, "depth", 0)
+        local.depth = self._depth + 1
+        self._start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        duration = time.perf_counter_ns() - self._start
+        self._profiler._local.depth = self._depth
+        self._profiler.records.append(
+            SpanRecord(self._name, self._start, duration, self._depth, threading.get_ident())
+        )
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class Profiler:
+    """Collects timing spans while enabled."""
+
+    def __init__(self) -> None:
+        self.enabled = False
+        self.records: List[SpanRecord] = []
+        self._local = threading.local()
+
+    def span(self, name: str) -> Any:
+        """Return a context manager timing the enclosed block."""
+        if not self.enabled:
+            return _NULL_SPAN
+        return _Span(self, name)
+
+    def reset(self) -> None:
+        """Discard recorded spans."""
+        self.records = []
+
+
+_profiler = Profiler()
+
+
+def enable() -> None:
+    """Start recording spans."""
+    _profiler.enabled = True
+
+
+def disable() -> None:
+    """Stop recording spans and discard what was recorded."""
+    _profiler.enabled = False
+    _profiler.reset()
+
+
+def is_enabled() -> bool:
+    """Check whether spans are being recorded."""
+    return _profiler.enabled
+
+
+def span(name: str) -> Any:
+    """Time a block of code.
+
+    Example:
+        with span("merge.agents"):
+            self._merge_subdirectory(template_subdir)
+
+    Args:
+        name: Phase name, dotted for sub-steps, e.g. ``validate.hooks``
+
+    Returns:
+        Context manager; a shared no-op when profiling is disabled
+    """
+    return _profiler.span(name)
+
+
+def timed(name: str) -> Callable[[F], F]:
+    """Decorator timing every call of a function under ``name``."""
+
+    def decorator(func: F) -> F:
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            if not _profiler.enabled:
+                return func(*args, **kwargs)
+            with _Span(_profiler, name):
+                return func(*args, **kwargs)
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorator
+
+
+def records() -> List[SpanRecord]:
+    """Return recorded spans in completion order."""
+    return list(_profiler.records)
+
+
+def format_report() -> str:
+    """Format a per-phase breakdown of recorded spans.
+
+    Spans with the same name at the same depth are aggregated, and phases are
+    listed in the order they first started, indented by nesting depth.
+
+    Returns:
+        Human-readable report
+    """
+    spans = sorted(_profiler.records, key=lambda r: r.start_ns)
+    if not spans:
+        return "🫧 No profiling spans recorded"
+
+    totals: Dict[Tuple[int, str], List[int]] = {}
+    for record in spans:
+        entry = totals.setdefault((record.depth, record.name), [0, 0])
+        entry[0] += record.duration_ns
+        entry[1] += 1
+    root_ns = sum(r.duration_ns for r in spans if r.depth == 0) or 1
+
+    lines = ["🫧 Profile breakdown:"]
+    for (depth, name), (total_ns, count) in totals.items():
+        label = "  " * depth + name
+        calls = f"  x{count}" if count > 1 else ""
+        lines.append(
+            f"   {label:<40} {total_ns / 1e6:>9.2f} ms {total_ns / root_ns * 100:>6.1f}%{calls}"
+        )
+    lines.append(f"   {'total':<40} {root_ns / 1e6:>9.2f} ms")
+    return "\n".join(lines)
+
+
+def write_chrome_trace(path: Path) -> None:
+    """Write recorded spans as Chrome trace JSON (chrome://tracing, Perfetto).
+
+    Args:
+        path: Output file path
+    """
+    import json
+
+    pid = os.getpid()
+    events = [
+        {
+            "name": record.name,
+            "cat": record.name.split(".", 1)[0],
+            "ph": "X",
+            "ts": record.start_ns / 1000,
+            "dur": record.duration_ns / 1000,
+            "pid": pid,
+            "tid": record.thread_id,
+        }
+        for record in sorted(_profiler.records, key=lambda r: r.start_ns)
+    ]
+    Path(path).write_text(json.dumps({"traceEvents": events, "displayTimeUnit": "ms"}))
+
+
+def report(trace_path: Optional[Path] = None) -> None:
+    """Print the breakdown and optionally write a Chrome trace."""
+    print(format_report())
+    if trace_path is not None:
+        try:
+            write_chrome_trace(trace_path)
+        except OSError as e:
+            print(f"⚠️  Warning: Could not write Chrome trace to {trace_path}: {e}")
+            return
+        print(f"🫧 Chrome trace written to: {trace_path}")
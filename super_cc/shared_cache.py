@@ -0,0 +1,268 @@
+"""
+Super CC Shared Summary Cache
+
+Lets clones, worktrees and CI checkouts of the same repository reuse each
+other's per-file summaries. Entries are keyed by the file's git blob SHA and
+the summarizer version, so identical content is summarized once no matter
+which branch or clone produced it.
+
+The cache is optional. Point SUPER_CC_SHARED_CACHE (or --shared-dir) at a
+directory, or set it to "user" for ~/.cache/super-cc/summaries. A team can
+use a directory on a shared filesystem.
+"""
+
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+from . import __version__
+from .fsutil import write_json
+from .profiling import timed
+
+ENV_VAR = "SUPER_CC_SHARED_CACHE"
+LAYOUT_VERSION = "v1"
+
+
+def resolve_cache_dir(value: Optional[str] = None) -> Optional[Path]:
+    """Resolve the shared cache directory.
+
+    Args:
+        value: Explicit directory or "user"; defaults to $SUPER_CC_SHARED_CACHE
+
+    Returns:
+        Cache directory, or None if no shared cache is configured
+    """
+    value = value or os.environ.get(ENV_VAR)
+    if not value:
+        return None
+    if value == "user":
+        base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+        return Path(base) / "super-cc" / "summaries"
+    return Path(value).expanduser()
+
+
+def blob_sha(path: Path) -> str:
+    """Compute the git blob SHA of a file, as ``git hash-object`` would."""
+    data = Path(path).read_bytes()
+    digest = hashlib.sha1(b"blob %d\0" % len(data))
+    digest.update(data)
+    return digest.hexdigest()
+
+
+def summarizer_version(repo_path: Path) -> str:
+    """Identify the summarizer, so prompt changes invalidate old entries.
+
+    Uses a hash of the installed context-synth agent definition, falling back
+    to the package version.
+    """
+    agent = Path(repo_path) / ".claude" / "agents" / "context-synth.md"
+    try:
+        return "agent-" + hashlib.sha1(agent.read_bytes()).hexdigest()[:12]
+    except OSError:
+        return f"pkg-{__version__}"
+
+
+def summary_filename(rel_path: str) -> str:
+    """Name of the summary file written for a restored entry."""
+    return rel_path.replace("/", "__") + "_summary.json"
+
+
+class LocalCacheBackend:
+    """Shared cache stored on a local or network filesystem.
+
+    Safe for concurrent writers: entries are written atomically, so readers
+    see either nothing or a complete entry.
+    """
+
+    def __init__(self, root: Path):
+        """Initialize backend.
+
+        Args:
+            root: Shared cache directory
+        """
+        self.root = Path(root)
+
+    def _entry_path(self, version: str, sha: str) -> Path:
+        return self.root / LAYOUT_VERSION / version / sha[:2] / f"{sha}.json"
+
+    def contains(self, version: str, sha: str) -> bool:
+        """Check for an entry without reading it."""
+        return self._entry_path(version, sha).is_file()
+
+    def get(self, version: str, sha: str) -> Optional[Dict]:
+        """Read an entry, treating missing or corrupt entries as absent."""
+        try:
+            data = json.loads(self._entry_path(version, sha).read_text())
+        except (OSError, ValueError):
+            return None
+        return data if isinstance(data, dict) else None
+
+    def put(self, version: str, sha: str, summary: Dict) -> None:
+        """Write an entry atomically."""
+        write_json(self._entry_path(version, sha), summary, compact=True)
+
+
+class SharedSummaryCache:
+    """Restores and publishes a repository's summaries via a shared backend."""
+
+    def __init__(self, repo_path: Path, backend: LocalCacheBackend, version: Optional[str] = None):
+        """Initialize cache for repository.
+
+        Args:
+            repo_path: Path to the repository
+            backend: Storage backend
+            version: Summarizer version; detected from the repo if omitted
+        """
+        self.repo_path = Path(repo_path).resolve()
+        self.backend = backend
+        self.version = version or summarizer_version(self.repo_path)
+        self.summaries_dir = self.repo_path / ".claude" / "context" / "summaries"
+        self.stats_path = self.repo_path / ".claude" / "state" / "cache-stats.json"
+        self.hits = 0
+        self.misses = 0
+        self.stores = 0
+
+    @classmethod
+    def from_config(cls, repo_path: Path, shared_dir: Optional[str] = None) -> Optional["SharedSummaryCache"]:
+        """Create a cache if a shared directory is configured, else None."""
+        root = resolve_cache_dir(shared_dir)
+        if root is None:
+            return None
+        return cls(repo_path, LocalCacheBackend(root))
+
+    @timed("shared_cache.restore")
+    def restore(self, rel_paths: Iterable[str]) -> List[str]:
+        """Write cached summaries for files whose content is in the cache.
+
+        Args:
+            rel_paths: Repo-relative files needing summaries
+
+        Returns:
+            Paths that were restored; the rest still need summarizing
+        """
+        restored = []
+        for rel_path in rel_paths:
+            try:
+                sha = blob_sha(self.repo_path / rel_path)
+            except OSError:
+                continue
+            entry = self.backend.get(self.version, sha)
+            if entry is None:
+                self.misses += 1
+                continue
+            self.hits += 1
+            summary = dict(entry, path=rel_path, blob=sha)
+            write_json(self.summaries_dir / summary_filename(rel_path), summary)
+            restored.append(rel_path)
+        return restored
+
+    @timed("shared_cache.publish")
+    def publish(self, blobs: Optional[Dict[str, str]] = None) -> int:
+        """Copy local summaries into the shared cache.
+
+        An entry is only published under the SHA of the content it was made
+        from. The summarizer may read one version of a file while the user
+        saves the next, so the current file's SHA alone proves nothing.
+
+        Args:
+            blobs: Blob SHAs of files taken just before they were summarized.
+                Only these files are published, and only if their content is
+                unchanged; their local summaries get the SHA recorded as
+                ``blob``. By default every summary is published whose
+                recorded ``blob`` matches the current file or, lacking one,
+                whose summary file is newer than the file's last change.
+
+        Returns:
+            Number of entries stored
+        """
+        from .context_index import SummaryIndex
+
+        index = SummaryIndex(self.repo_path)
+        index.refresh()
+        stored = 0
+        verified: Dict[Path, Dict[str, str]] = {}
+        written: Dict[Path, int] = {}
+        for rel_path, entry, source in index.entries(blobs):
+            file_path = self.repo_path / rel_path
+            try:
+                sha = blob_sha(file_path)
+                if blobs is None and "blob" not in entry:
+                    # Summaries written by the agent carry no SHA; trust those
+                    # written after the file was last saved
+                    if source not in written:
+                        written[source] = source.stat().st_mtime_ns
+                    if written[source] <= file_path.stat().st_mtime_ns:
+                        continue
+                    expected: Optional[str] = sha
+                else:
+                    expected = entry.get("blob") if blobs is None else blobs.get(rel_path)
+            except OSError:
+                continue
+            if expected != sha:
+                continue
+            if entry.get("blob") != sha:
+                verified.setdefault(source, {})[rel_path] = sha
+            if self.backend.contains(self.version, sha):
+                continue
+            summary = {k: v for k, v in entry.items() if k not in ("path", "blob")}
+            self.backend.put(self.version, sha, summary)
+            stored += 1
+        for source, shas in verified.items():
+            _record_blobs(source, shas)
+        self.stores += stored
+        return stored
+
+    def stats(self) -> Dict[str, object]:
+        """Return counters for this session."""
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "stores": self.stores,
+            "hit_rate": round(self.hits / lookups, 3) if lookups else None,
+        }
+
+    def flush_stats(self) -> Dict[str, object]:
+        """Add this session's counters to .claude/state/cache-stats.json.
+
+        Returns:
+            Cumulative shared-cache statistics for the repository
+        """
+        try:
+            data = json.loads(self.stats_path.read_text())
+        except (OSError, ValueError):
+            data = {}
+        totals: Dict[str, Any] = data.get("shared_cache", {})
+        for key in ("hits", "misses", "stores"):
+            totals[key] = totals.get(key, 0) + getattr(self, key)
+        lookups = totals["hits"] + totals["misses"]
+        totals["hit_rate"] = round(totals["hits"] / lookups, 3) if lookups else None
+        totals["backend"] = str(self.backend.root)
+        data["shared_cache"] = totals
+        write_json(self.stats_path, data)
+        self.hits = self.misses = self.stores = 0
+        return totals
+
+
+def _record_blobs(source: Path, shas: Dict[str, str]) -> None:
+    """Record the content SHA each summary in a summary file was made from."""
+    try:
+        data = json.loads(source.read_text())
+    except (OSError, ValueError):
+        return
+    if not isinstance(data, dict):
+        return
+    files = data.get("files")
+    entries = files if isinstance(files, list) else [data]
+    default_path = source.name[: -len("_summary.json")]
+    for entry in entries:
+        if isinstance(entry, dict):
+            sha = shas.get(entry.get("path", default_path))
+            if sha is not None:
+                entry["blob"] = sha
+    try:
+        write_json(source, data)
+    except OSError as e:
+        print(f"⚠️  Warning: Could not record summary blobs in {source.name}: {e}")
@@ -0,0 +1,370 @@
+"""
+Super CC Test Impact Selection
+
+Maps source files to the tests that exercise them, using coverage data, so
+TDD and review loops can run only the tests affected by a change.
+
+Coverage is ingested from coverage.py data files (recorded with per-test
+contexts, e.g. ``pytest --cov --cov-context=test``) or lcov tracefiles
+(vitest, cargo-llvm-cov, gcov2lcov for Go). Test ids are pytest node ids,
+vitest test files, ``<package dir>::<TestName>`` for Go and test paths for
+cargo. The index lives in
+.claude/state/test-impact.json and each ingest only replaces the mappings of
+the tests it contains.
+"""
+
+import json
+import os
+import sqlite3
+import subprocess
+from pathlib import Path
+from typing import Dict, Iterable, List, NamedTuple, Optional, Set
+
+from .fsutil import write_json
+from .profiling import timed
+
+INDEX_VERSION = 1
+RUNNERS = ("pytest", "vitest", "go", "cargo")
+DEFAULT_FULL_EVERY = 10
+
+# Changes to these invalidate coverage-based selection entirely
+FULL_RUN_FILES = frozenset({
+    "conftest.py", "pyproject.toml", "setup.cfg", "setup.py", "pytest.ini", "tox.ini",
+    "package.json", "package-lock.json", "pnpm-lock.yaml", "yarn.lock", "tsconfig.json",
+    "go.mod", "go.sum", "Cargo.toml", "Cargo.lock",
+})
+FULL_RUN_PREFIXES = ("requirements", "vitest.config", "vite.config")
+
+
+class Selection(NamedTuple):
+    """Tests to run for a change."""
+
+    full: bool
+    reason: str
+    tests: Dict[str, List[str]]
+    changed: List[str]
+
+
+class TestImpactIndex:
+    """File-to-tests index backed by .claude/state/test-impact.json."""
+
+    __test__ = False  # Not a pytest test class despite the name
+
+    def __init__(self, repo_path: Path):
+        """Initialize index for repository.
+
+        Args:
+            repo_path: Path to the repository
+        """
+        self.repo_path = Path(repo_path).resolve()
+        self.index_path = self.repo_path / ".claude" / "state" / "test-impact.json"
+        self.tests: Dict[str, str] = {}
+        self.files: Dict[str, Set[str]] = {}
+        self.runs_since_full = 0
+        self._load()
+
+    @timed("testimpact.ingest")
+    def ingest(self, coverage_path: Path, runner: Optional[str] = None, test_name: Optional[str] = None) -> int:
+        """Merge a coverage file into the index.
+
+        Args:
+            coverage_path: coverage.py data file or lcov tracefile
+            runner: Runner owning the tests; defaults to pytest for coverage.py
+                data and vitest for lcov
+            test_name: Test id for lcov data without per-test ``TN:`` records
+
+        Returns:
+            Number of tests whose mappings were updated
+        """
+        coverage_path = Path(coverage_path)
+        if _is_sqlite(coverage_path):
+            mapping = self._read_coveragepy(coverage_path)
+            runner = runner or "pytest"
+        else:
+            mapping = self._read_lcov(coverage_path, test_name)
+            runner = runner or "vitest"
+        if runner not in RUNNERS:
+            raise ValueError(f"Unknown runner '{runner}' (expected one of: {', '.join(RUNNERS)})")
+
+        # Replace everything previously recorded for the ingested tests
+        for tests in self.files.values():
+            tests.difference_update(mapping)
+        for test_id, files in mapping.items():
+            self.tests[test_id] = runner
+            for rel_path in files:
+                self.files.setdefault(rel_path, set()).add(test_id)
+        self.files = {path: tests for path, tests in self.files.items() if tests}
+        self._save()
+        return len(mapping)
+
+    @timed("testimpact.select")
+    def select(
+        self,
+        changed: Iterable[str],
+        full_every: int = DEFAULT_FULL_EVERY,
+        force_full: bool = False,
+    ) -> Selection:
+        """Choose the tests affected by a set of changed files.
+
+        Every ``full_every`` selections the full suite is requested instead,
+        as a safety valve against stale or incomplete coverage.
+
+        Args:
+            changed: Repo-relative paths of changed files
+            full_every: Request a full run after this many selective runs (0 disables)
+            force_full: Always request a full run
+
+        Returns:
+            The selection; when ``full`` is set, run the whole suite
+        """
+        changed = sorted(set(changed))
+        self._forget([p for p in changed if not (self.repo_path / p).exists()])
+        reason = ""
+        if force_full:
+            reason = "full run requested"
+        elif not self.tests:
+            reason = "no coverage data ingested yet"
+        elif full_every and self.runs_since_full + 1 >= full_every:
+            reason = f"periodic full run (every {full_every} runs)"
+        else:
+            config = [p for p in changed if _is_full_run_file(p)]
+            if config:
+                reason = f"configuration changed: {', '.join(config[:3])}"
+
+        if reason:
+            self.runs_since_full = 0
+            self._save()
+            return Selection(True, reason, {}, changed)
+
+        # Edited test files run whole: their recorded test ids may be stale
+        test_files = {_test_file(runner, test_id): runner for test_id, runner in self.tests.items()}
+        edited: Dict[str, str] = {}
+        for rel_path in changed:
+            runner = test_files.get(rel_path) or _runner_for_test_file(rel_path)
+            if runner is not None and (self.repo_path / rel_path).is_file():
+                edited[rel_path] = runner
+        selected: Dict[str, Set[str]] = {}
+        for rel_path in changed:
+            for test_id in self.files.get(rel_path, ()):
+                runner = self.tests[test_id]
+                if _test_file(runner, test_id) not in edited:
+                    selected.setdefault(runner, set()).add(test_id)
+        for rel_path, runner in edited.items():
+            if runner == "go":
+                selected.setdefault(runner, set()).add(f"{os.path.dirname(rel_path) or '.'}::")
+            else:
+                selected.setdefault(runner, set()).add(rel_path)
+
+        self.runs_since_full += 1
+        self._save()
+        tests = {runner: sorted(ids) for runner, ids in selected.items()}
+        return Selection(False, "coverage-based selection", tests, changed)
+
+    def full_commands(self) -> List[List[str]]:
+        """Full-suite commands for every runner with tests in the index."""
+        full = {
+            "pytest": ["pytest"],
+            "vitest": ["vitest", "run"],
+            "go": ["go", "test", "./..."],
+            "cargo": ["cargo", "test"],
+        }
+        runners = set(self.tests.values())
+        return [full[runner] for runner in RUNNERS if runner in runners]
+
+    def _forget(self, deleted: List[str]) -> None:
+        """Drop deleted files and the tests that lived in them from the index."""
+        if not deleted:
+            return
+        gone = set(deleted)
+        stale = {test_id for test_id, runner in self.tests.items() if _test_file(runner, test_id) in gone}
+        for test_id in stale:
+            del self.tests[test_id]
+        self.files = {
+            path: tests - stale for path, tests in self.files.items()
+            if path not in gone and tests - stale
+        }
+
+    def _read_coveragepy(self, path: Path) -> Dict[str, Set[str]]:
+        """Read per-test file coverage from a coverage.py SQLite data file."""
+        mapping: Dict[str, Set[str]] = {}
+        with sqlite3.connect(f"file:{path}?mode=ro", uri=True) as db:
+            tables = {row[0] for row in db.execute("SELECT name FROM sqlite_master WHERE type='table'")}
+            queries = [
+                f"SELECT DISTINCT file.path, context.context FROM {table} "
+                f"JOIN file ON file.id = {table}.file_id "
+                f"JOIN context ON context.id = {table}.context_id"
+                for table in ("line_bits", "arc") if table in tables
+            ]
+            for query in queries:
+                for file_path, context in db.execute(query):
+                    test_id = _context_to_test_id(context)
+                    rel_path = self._relative(file_path)
+                    if test_id and rel_path:
+                        mapping.setdefault(test_id, set()).add(rel_path)
+        if not mapping:
+            print("⚠️  Warning: No per-test contexts found; record coverage with --cov-context=test")
+        return mapping
+
+    def _read_lcov(self, path: Path, test_name: Optional[str]) -> Dict[str, Set[str]]:
+        """Read per-test file coverage from an lcov tracefile."""
+        mapping: Dict[str, Set[str]] = {}
+        current_test = test_name
+        current_file: Optional[str] = None
+        hit = False
+        with open(path, encoding="utf-8", errors="replace") as f:
+            for line in f:
+                line = line.strip()
+                if line.startswith("TN:"):
+                    current_test = line[3:] or test_name
+                elif line.startswith("SF:"):
+                    current_file, hit = self._relative(line[3:]), False
+                elif line.startswith("DA:"):
+                    hit = hit or not line.endswith(",0")
+                elif line == "end_of_record":
+                    if current_test and current_file and hit:
+                        mapping.setdefault(current_test, set()).add(current_file)
+                    current_file = None
+        if not mapping:
+            print("⚠️  Warning: No per-test records found; pass --test-name for single-test lcov files")
+        return mapping
+
+    def _relative(self, file_path: str) -> Optional[str]:
+        """Make a coverage path repo-relative, dropping files outside the repo."""
+        path = Path(file_path)
+        if not path.is_absolute():
+            return path.as_posix()
+        try:
+            return path.resolve().relative_to(self.repo_path).as_posix()
+        except ValueError:
+            return None
+
+    def _load(self) -> None:
+        try:
+            data = json.loads(self.index_path.read_text())
+        except (OSError, ValueError):
+            return
+        if data.get("version") != INDEX_VERSION:
+            return
+        test_ids = [test_id for test_id, _ in data["tests"]]
+        self.tests = dict(data["tests"])
+        self.files = {path: {test_ids[i] for i in ids} for path, ids in data["files"].items()}
+        self.runs_since_full = data.get("runs_since_full", 0)
+
+    def _save(self) -> None:
+        """Persist the index with test ids interned to keep it compact."""
+        ordered = sorted(self.tests.items())
+        positions = {test_id: i for i, (test_id, _) in enumerate(ordered)}
+        payload = {
+            "version": INDEX_VERSION,
+            "runs_since_full": self.runs_since_full,
+            "tests": [list(item) for item in ordered],
+            "files": {path: sorted(positions[t] for t in tests) for path, tests in sorted(self.files.items())},
+        }
+        write_json(self.index_path, payload, compact=True)
+
+
+def changed_files(repo_path: Path, since: Optional[str] = None) -> List[str]:
+    """List files changed since a commit, including uncommitted and untracked files.
+
+    Args:
+        repo_path: Path to the repository
+        since: Commit to diff against; defaults to .claude/context/last-build-commit
+
+    Returns:
+        Repo-relative paths
+
+    Raises:
+        ValueError: If no base commit is given or recorded
+    """
+    repo_path = Path(repo_path)
+    if since is None:
+        marker = repo_path / ".claude" / "context" / "last-build-commit"
+        try:
+            since = marker.read_text().strip()
+        except OSError:
+            since = ""
+        if not since:
+            raise ValueError("No base commit: pass --since or record .claude/context/last-build-commit")
+
+    changed: Set[str] = set()
+    for args in (["git", "diff", "--name-only", since], ["git", "ls-files", "--others", "--exclude-standard"]):
+        result = subprocess.run(args, cwd=repo_path, capture_output=True, text=True)
+        if result.returncode != 0:
+            raise ValueError(f"{' '.join(args)} failed: {result.stderr.strip()}")
+        changed.update(line for line in result.stdout.splitlines() if line)
+    return sorted(changed)
+
+
+def build_commands(selection: Selection) -> List[List[str]]:
+    """Turn a selection into runner command lines.
+
+    Args:
+        selection: Result of TestImpactIndex.select()
+
+    Returns:
+        One argv list per runner invocation, empty if nothing needs to run
+    """
+    commands = []
+    for runner in RUNNERS:
+        tests = selection.tests.get(runner)
+        if not tests:
+            continue
+        if runner == "pytest":
+            commands.append(["pytest"] + tests)
+        elif runner == "vitest":
+            commands.append(["vitest", "run"] + sorted({_test_file("vitest", t) for t in tests}))
+        elif runner == "cargo":
+            commands.append(["cargo", "test", "--", "--exact"] + tests)
+        elif runner == "go":
+            packages: Dict[str, Set[str]] = {}
+            for test_id in tests:
+                package, _, name = test_id.partition("::")
+                packages.setdefault(package, set()).add(name)
+            for package, names in sorted(packages.items()):
+                command = ["go", "test", "./" + package if package != "." else "."]
+                if "" not in names:
+                    command += ["-run", "^(" + "|".join(sorted(names)) + ")$"]
+                commands.append(command)
+    return commands
+
+
+def _context_to_test_id(context: str) -> Optional[str]:
+    """Convert a coverage.py context such as "tests/test_a.py::test_x|run" to a test id."""
+    if not context:
+        return None
+    test_id, _, phase = context.rpartition("|")
+    if not test_id:
+        test_id = phase
+    return test_id or None
+
+
+def _test_file(runner: str, test_id: str) -> str:
+    """The file a test id lives in, where the id encodes one."""
+    if runner == "pytest":
+        return test_id.split("::", 1)[0]
+    if runner == "vitest":
+        return test_id.split(" > ", 1)[0]
+    return ""
+
+
+def _runner_for_test_file(rel_path: str) -> Optional[str]:
+    """Guess the runner for a test file that has no coverage yet."""
+    name = os.path.basename(rel_path)
+    if name.endswith(".py") and (name.startswith("test_") or name.endswith("_test.py")):
+        return "pytest"
+    if name.endswith("_test.go"):
+        return "go"
+    for marker in (".test.", ".spec."):
+        if marker in name and name.rsplit(".", 1)[-1] in ("js", "jsx", "ts", "tsx", "mjs", "cjs", "mts", "cts"):
+            return "vitest"
+    return None
+
+
+def _is_full_run_file(rel_path: str) -> bool:
+    name = os.path.basename(rel_path)
+    return name in FULL_RUN_FILES or name.startswith(FULL_RUN_PREFIXES)
+
+
+def _is_sqlite(path: Path) -> bool:
+    with open(path, "rb") as f:
+        return f.read(16) == b"SQLite format 3\0"
@@ -8,7 +8,10 @@ import subprocess
 from pathlib import Path
 from typing import List, Tuple
 
+from .profiling import span, timed
 
+
+@timed("validate")
 def validate_environment(repo_path: Path) -> bool:
     """Validate Super CC environment setup.
     
@@ -34,12 +37,13 @@ def validate_environment(repo_path: Path) -> bool:
     
     # Validate directory structure
     required_dirs = ["agents", "commands", "hooks", "logs", "state", "workflows"]
-    for dir_name in required_dirs:
-        dir_path = claude_dir / dir_name
-        if not dir_path.exists():
-            issues.append(f"❌ Missing directory: .claude/{dir_name}/")
-        else:
-            print(f"🫧 Found: .claude/{dir_name}/")
+    with span("validate.structure"):
+        for dir_name in required_dirs:
+            dir_path = claude_dir / dir_name
+            if not dir_path.exists():
+                issues.append(f"❌ Missing directory: .claude/{dir_name}/")
+            else:
+                print(f"🫧 Found: .claude/{dir_name}/")
     
     # Validate agents
     agent_issues, agent_warnings = _validate_agents(claude_dir / "agents")
@@ -82,6 +86,7 @@ def validate_environment(repo_path: Path) -> bool:
     return True
 
 
+@timed("validate.agents")
 def _validate_agents(agents_dir: Path) -> Tuple[List[str], List[str]]:
     """Validate agent files."""
     issues = []
@@ -114,6 +119,7 @@ def _validate_agents(agents_dir: Path) -> Tuple[List[str], List[str]]:
     return issues, warnings
 
 
+@timed("validate.commands")
 def _validate_commands(commands_dir: Path) -> Tuple[List[str], List[str]]:
     """Validate command files."""
     issues = []
@@ -136,6 +142,7 @@ def _validate_commands(commands_dir: Path) -> Tuple[List[str], List[str]]:
     return issues, warnings
 
 
+@timed("validate.hooks")
 def _validate_hooks(hooks_dir: Path) -> Tuple[List[str], List[str]]:
     """Validate hook files."""
     issues = []
@@ -160,6 +167,7 @@ def _validate_hooks(hooks_dir: Path) -> Tuple[List[str], List[str]]:
     return issues, warnings
 
 
+@timed("validate.workflows")
 def _validate_workflows(workflows_dir: Path) -> Tuple[List[str], List[str]]:
     """Validate workflow files."""
     issues = []
@@ -177,6 +185,7 @@ def _validate_workflows(workflows_dir: Path) -> Tuple[List[str], List[str]]:
     return issues, warnings
 
 
+@timed("validate.claude_code")
 def _validate_claude_code() -> Tuple[List[str], List[str]]:
     """Validate Claude Code installation."""
     issues = []
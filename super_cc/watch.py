@@ -0,0 +1,466 @@
+"""
+Super CC Watch Mode
+
+Keeps context summaries warm by re-summarizing files as they change. Uses
+inotify on Linux and falls back to scandir polling elsewhere, or when the
+inotify watch limit is exhausted. Paths ignored by git or excluded by the
+Claude Code .gitignore entries never trigger work.
+"""
+
+import ctypes
+import ctypes.util
+import errno
+import os
+import select
+import shlex
+import struct
+import subprocess
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Callable, Dict, Iterator, List, Optional, Set, Tuple
+
+from .context_index import SummaryIndex, is_summarizable
+from .gitignore import GitignoreMatcher, walk
+from .integration import GitignoreManager
+from .profiling import span
+from .shared_cache import SharedSummaryCache, blob_sha
+
+DEFAULT_COMMAND = 'claude -p "/context-synth {files}"'
+
+# inotify constants from <sys/inotify.h>
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ONLYDIR = 0x01000000
+IN_DONT_FOLLOW = 0x02000000
+IN_ISDIR = 0x40000000
+IN_NONBLOCK = os.O_NONBLOCK
+IN_CLOEXEC = os.O_CLOEXEC
+
+WATCH_MASK = (
+    IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE
+    | IN_DELETE_SELF | IN_ONLYDIR | IN_DONT_FOLLOW
+)
+EVENT_HEADER = struct.Struct("iIII")
+
+# Flush a batch after this many debounce windows even if saves keep coming
+MAX_DELAY_FACTOR = 10
+
+# Paths passed to one summarizer run, in bytes. Linux caps a single argument
+# at 128 KiB, which a space-joined "{files}" token must stay under.
+MAX_ARGV_BYTES = 64 * 1024
+
+
+class InotifyUnavailable(Exception):
+    """Raised when inotify cannot be used and polling should take over."""
+
+
+class _Inotify:
+    """Minimal ctypes binding to Linux inotify."""
+
+    def __init__(self) -> None:
+        if not sys.platform.startswith("linux"):
+            raise InotifyUnavailable("inotify is only available on Linux")
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        try:
+            self._add_watch = libc.inotify_add_watch
+        except AttributeError as e:
+            raise InotifyUnavailable("libc does not provide inotify") from e
+        self._add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+        self.fd = libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if self.fd < 0:
+            raise InotifyUnavailable(os.strerror(ctypes.get_errno()))
+
+    def add_watch(self, path: Path) -> int:
+        """Watch a directory, returning its watch descriptor."""
+        wd: int = self._add_watch(self.fd, os.fsencode(path), WATCH_MASK)
+        if wd < 0:
+            err = ctypes.get_errno()
+            if err == errno.ENOSPC:
+                raise InotifyUnavailable(
+                    "inotify watch limit reached (raise fs.inotify.max_user_watches)"
+                )
+            raise OSError(err, os.strerror(err), str(path))
+        return wd
+
+    def read_events(self) -> List[Tuple[int, int, str]]:
+        """Read pending events as (watch descriptor, mask, name) tuples."""
+        try:
+            data = os.read(self.fd, 64 * 1024)
+        except BlockingIOError:
+            return []
+        events = []
+        offset = 0
+        while offset < len(data):
+            wd, mask, _, length = EVENT_HEADER.unpack_from(data, offset)
+            offset += EVENT_HEADER.size
+            name = os.fsdecode(data[offset:offset + length].rstrip(b"\0"))
+            offset += length
+            events.append((wd, mask, name))
+        return events
+
+    def close(self) -> None:
+        os.close(self.fd)
+
+
+class _BatchWorker(threading.Thread):
+    """Runs the change handler in the background, coalescing batches.
+
+    Paths submitted while a batch is running are merged into the next one,
+    so a slow summarizer never queues up redundant runs.
+    """
+
+    def __init__(self, handler: Callable[[Set[str]], None]):
+        super().__init__(name="super-cc-summarizer", daemon=True)
+        self._handler = handler
+        self._pending: Set[str] = set()
+        self._lock = threading.Lock()
+        self._ready = threading.Event()
+
+    def submit(self, paths: Set[str]) -> None:
+        with self._lock:
+            self._pending |= paths
+        self._ready.set()
+
+    def run(self) -> None:
+        while True:
+            self._ready.wait()
+            with self._lock:
+                batch, self._pending = self._pending, set()
+                self._ready.clear()
+            if batch:
+                try:
+                    self._handler(batch)
+                except Exception as e:
+                    print(f"⚠️  Warning: Re-summarizing failed: {e}")
+
+
+class RepoWatcher:
+    """Watches a repository and reports debounced batches of changed files."""
+
+    def __init__(
+        self,
+        repo_path: Path,
+        on_change: Callable[[Set[str]], None],
+        debounce: float = 0.5,
+        poll_interval: float = 2.0,
+        force_poll: bool = False,
+    ):
+        """Initialize watcher for repository.
+
+        Args:
+            repo_path: Path to the repository
+            on_change: Called from a background thread with repo-relative
+                paths that changed, including deleted ones
+            debounce: Seconds of quiet before a burst of saves is flushed
+            poll_interval: Seconds between scans in polling mode
+            force_poll: Use polling even where inotify is available
+        """
+        self.repo_path = Path(repo_path).resolve()
+        self.debounce = debounce
+        self.poll_interval = poll_interval
+        self.force_poll = force_poll
+        self.matcher = self._load_matcher()
+        self._worker = _BatchWorker(on_change)
+        self._stop = threading.Event()
+
+    def run(self) -> None:
+        """Watch until stop() is called or the process is interrupted."""
+        self._worker.start()
+        if not self.force_poll:
+            try:
+                inotify = _Inotify()
+            except (InotifyUnavailable, OSError) as e:
+                print(f"⚠️  inotify unavailable ({e}); falling back to polling")
+            else:
+                try:
+                    self._run_inotify(inotify)
+                    return
+                except InotifyUnavailable as e:
+                    print(f"⚠️  {e}; falling back to polling")
+                finally:
+                    inotify.close()
+        self._run_polling()
+
+    def stop(self) -> None:
+        """Ask the watch loop to exit."""
+        self._stop.set()
+
+    def _load_matcher(self) -> GitignoreMatcher:
+        """Build a fresh matcher; it caches ignore files, so rebuild on changes."""
+        return GitignoreMatcher(self.repo_path, GitignoreManager.CLAUDE_ENTRIES)
+
+    def _is_relevant(self, rel_path: str, is_dir: bool) -> bool:
+        return ".git" not in rel_path.split("/") and not self.matcher.is_ignored(rel_path, is_dir)
+
+    def _run_inotify(self, inotify: _Inotify) -> None:
+        """Event loop backed by inotify."""
+        watches: Dict[int, str] = {}
+
+        def add_tree(rel_root: str, pending: Optional[Set[str]]) -> None:
+            for rel_dir, _, files in walk(self.matcher, rel_root):
+                try:
+                    watches[inotify.add_watch(self.repo_path / rel_dir)] = rel_dir
+                except FileNotFoundError:
+                    # Removed again before we got to it
+                    continue
+                if pending is not None:
+                    pending.update(f"{rel_dir}/{f.name}" if rel_dir else f.name for f in files)
+
+        with span("watch.setup"):
+            add_tree("", None)
+            # Baseline for rescans after a queue overflow or an ignore-rule change
+            snapshot = self._snapshot()
+        print(f"🫧 Watching {len(watches)} directories with inotify")
+
+        pending: Set[str] = set()
+        first_event = last_event = 0.0
+        while not self._stop.is_set():
+            if pending:
+                now = time.monotonic()
+                deadline = min(last_event + self.debounce, first_event + self.debounce * MAX_DELAY_FACTOR)
+                timeout = max(0.0, deadline - now)
+            else:
+                timeout = 1.0
+            readable, _, _ = select.select([inotify.fd], [], [], timeout)
+
+            if not readable:
+                if pending:
+                    self._worker.submit(pending)
+                    self._update_snapshot(snapshot, pending)
+                    pending = set()
+                continue
+
+            was_idle = not pending
+            rescan = rules_changed = False
+            for wd, mask, name in inotify.read_events():
+                if mask & IN_Q_OVERFLOW:
+                    print("⚠️  inotify queue overflowed; rescanning the repository")
+                    rescan = True
+                    continue
+                if mask & IN_IGNORED:
+                    watches.pop(wd, None)
+                    continue
+                rel_dir = watches.get(wd)
+                if rel_dir is None or not name:
+                    continue
+                rel_path = f"{rel_dir}/{name}" if rel_dir else name
+                is_dir = bool(mask & IN_ISDIR)
+                if name == ".gitignore" and not is_dir:
+                    self.matcher = self._load_matcher()
+                    rescan = rules_changed = True
+                if not self._is_relevant(rel_path, is_dir):
+                    continue
+                if is_dir:
+                    if mask & (IN_CREATE | IN_MOVED_TO):
+                        # Files may land before the new watch is in place
+                        add_tree(rel_path, pending)
+                    elif mask & (IN_MOVED_FROM | IN_DELETE):
+                        # Summaries of everything below it are now stale
+                        pending.add(rel_path)
+                elif mask & (IN_CLOSE_WRITE | IN_MOVED_TO | IN_MOVED_FROM | IN_DELETE):
+                    pending.add(rel_path)
+
+            if rescan:
+                with span("watch.rescan"):
+                    if rules_changed:
+                        # Directories may have become visible and need watches
+                        add_tree("", None)
+                    current = self._snapshot()
+                    pending |= _diff(snapshot, current)
+                    snapshot = current
+
+            if pending:
+                last_event = time.monotonic()
+                if was_idle:
+                    first_event = last_event
+
+    def _run_polling(self) -> None:
+        """Fallback loop comparing scandir snapshots."""
+        snapshot = self._snapshot()
+        print(f"🫧 Polling {len(snapshot)} files every {self.poll_interval:g}s")
+        pending: Set[str] = set()
+        while not self._stop.wait(self.poll_interval):
+            current = self._snapshot()
+            changed = _diff(snapshot, current)
+            if any(path.rsplit("/", 1)[-1] == ".gitignore" for path in changed):
+                # Ignore rules changed: rescan so newly ignored or visible files show up
+                self.matcher = self._load_matcher()
+                current = self._snapshot()
+                changed = _diff(snapshot, current)
+            snapshot = current
+            if changed:
+                # Treat the next quiet scan as the end of the burst
+                pending |= changed
+            elif pending:
+                self._worker.submit(pending)
+                pending = set()
+
+    def _snapshot(self) -> Dict[str, Tuple[int, int]]:
+        """Map every unignored file to its (mtime_ns, size)."""
+        snapshot = {}
+        for rel_dir, _, files in walk(self.matcher):
+            for entry in files:
+                try:
+                    stat = entry.stat(follow_symlinks=False)
+                except OSError:
+                    continue
+                rel_path = f"{rel_dir}/{entry.name}" if rel_dir else entry.name
+                snapshot[rel_path] = (stat.st_mtime_ns, stat.st_size)
+        return snapshot
+
+    def _update_snapshot(self, snapshot: Dict[str, Tuple[int, int]], paths: Set[str]) -> None:
+        """Record the current state of flushed paths so rescans only report newer changes."""
+        for rel_path in paths:
+            try:
+                stat = os.lstat(self.repo_path / rel_path)
+            except OSError:
+                snapshot.pop(rel_path, None)
+                prefix = rel_path + "/"
+                for path in [p for p in snapshot if p.startswith(prefix)]:
+                    del snapshot[path]
+                continue
+            if not os.path.isdir(self.repo_path / rel_path):
+                snapshot[rel_path] = (stat.st_mtime_ns, stat.st_size)
+
+
+class CommandSummarizer:
+    """Re-summarizes changed files by running a shell-style command template.
+
+    Only source files are summarized (see ``is_summarizable``). The token
+    ``{files}`` is replaced by the changed paths: as separate arguments when
+    it stands alone, or space-joined inside a larger token. Large batches
+    are split across several runs to stay within argument-size limits, and
+    summaries of deleted files are removed.
+    With a shared cache, files whose content another clone already
+    summarized are restored instead, and fresh summaries are published.
+    """
+
+    def __init__(
+        self,
+        repo_path: Path,
+        command: str = DEFAULT_COMMAND,
+        shared_cache: Optional[SharedSummaryCache] = None,
+    ):
+        """Initialize summarizer.
+
+        Args:
+            repo_path: Path to the repository
+            command: Command template, e.g. ``claude -p "/context-synth {files}"``
+            shared_cache: Optional cross-clone summary cache
+        """
+        self.repo_path = Path(repo_path).resolve()
+        self.template = shlex.split(command)
+        self.shared_cache = shared_cache
+
+    def __call__(self, paths: Set[str]) -> None:
+        index = SummaryIndex(self.repo_path)
+        deleted = [p for p in paths if not (self.repo_path / p).exists()]
+        if deleted:
+            removed = index.forget(deleted)
+            if removed:
+                print(f"🫧 Removed {removed} summaries of deleted files")
+
+        files = sorted(p for p in paths if is_summarizable(p) and (self.repo_path / p).is_file())
+        if files and self.shared_cache is not None:
+            restored = set(self.shared_cache.restore(files))
+            if restored:
+                print(f"🫧 Restored {len(restored)} summaries from the shared cache")
+            files = [f for f in files if f not in restored]
+        if files:
+            print(f"🫧 Re-summarizing {len(files)} changed file(s)")
+        for chunk in _chunks(files, MAX_ARGV_BYTES):
+            # Hash before summarizing: files saved again mid-run must not be
+            # published under their new content
+            blobs = self._hash(chunk) if self.shared_cache is not None else {}
+            with span("watch.summarize"):
+                result = subprocess.run(
+                    self._build_command(chunk),
+                    cwd=self.repo_path,
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.PIPE,
+                    text=True,
+                )
+            if result.returncode != 0:
+                print(f"⚠️  Summarizer exited with {result.returncode}: {result.stderr.strip()[:200]}")
+            elif self.shared_cache is not None:
+                self.shared_cache.publish(blobs)
+        if self.shared_cache is not None:
+            self.shared_cache.flush_stats()
+
+        index.refresh()
+
+    def _hash(self, files: List[str]) -> Dict[str, str]:
+        blobs = {}
+        for rel_path in files:
+            try:
+                blobs[rel_path] = blob_sha(self.repo_path / rel_path)
+            except OSError:
+                continue
+        return blobs
+
+    def _build_command(self, files: List[str]) -> List[str]:
+        command = []
+        for token in self.template:
+            if token == "{files}":
+                command.extend(files)
+            else:
+                command.append(token.replace("{files}", " ".join(files)))
+        return command
+
+
+def _diff(old: Dict[str, Tuple[int, int]], new: Dict[str, Tuple[int, int]]) -> Set[str]:
+    """Paths added, modified or removed between two snapshots."""
+    changed = {path for path, sig in new.items() if old.get(path) != sig}
+    changed.update(path for path in old if path not in new)
+    return changed
+
+
+def _chunks(files: List[str], max_bytes: int) -> Iterator[List[str]]:
+    """Split paths into runs whose joined length stays under ``max_bytes``."""
+    chunk: List[str] = []
+    size = 0
+    for rel_path in files:
+        length = len(os.fsencode(rel_path)) + 1
+        if chunk and size + length > max_bytes:
+            yield chunk
+            chunk, size = [], 0
+        chunk.append(rel_path)
+        size += length
+    if chunk:
+        yield chunk
+
+
+def watch(
+    repo_path: Path,
+    command: str = DEFAULT_COMMAND,
+    debounce: float = 0.5,
+    poll_interval: float = 2.0,
+    force_poll: bool = False,
+    on_change: Optional[Callable[[Set[str]], None]] = None,
+    shared_dir: Optional[str] = None,
+) -> None:
+    """Watch a repository and keep its context summaries fresh.
+
+    Args:
+        repo_path: Path to the repository
+        command: Summarizer command template (see CommandSummarizer)
+        debounce: Seconds of quiet before a burst of saves is flushed
+        poll_interval: Seconds between scans in polling mode
+        force_poll: Use polling even where inotify is available
+        on_change: Handler overriding the command summarizer
+        shared_dir: Shared summary cache directory (default: $SUPER_CC_SHARED_CACHE)
+    """
+    if on_change is None:
+        shared_cache = SharedSummaryCache.from_config(repo_path, shared_dir)
+        if shared_cache is not None:
+            print(f"🫧 Using shared summary cache: {shared_cache.backend.root}")
+        on_change = CommandSummarizer(repo_path, command, shared_cache)
+    RepoWatcher(repo_path, on_change, debounce, poll_interval, force_poll).run()
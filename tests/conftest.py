@@ -0,0 +1,47 @@
+"""Shared fixtures for the Super CC test suite."""
+
+import subprocess
+from pathlib import Path
+from typing import Callable, Dict
+
+import pytest
+
+
+def run_git(repo: Path, *args: str, stdin: str = "") -> str:
+    """Run git in ``repo`` and return its stdout."""
+    result = subprocess.run(
+        ["git", "-c", "user.name=test", "-c", "user.email=test@example.com", *args],
+        cwd=repo,
+        input=stdin,
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    if result.returncode not in (0, 1):
+        raise AssertionError(f"git {' '.join(args)} failed: {result.stderr}")
+    return result.stdout
+
+
+@pytest.fixture
+def git_repo(tmp_path: Path) -> Path:
+    """An empty git repository."""
+    repo = tmp_path / "repo"
+    repo.mkdir()
+    run_git(repo, "init", "-q")
+    return repo
+
+
+@pytest.fixture
+def write_files() -> Callable[[Path, Dict[str, str]], None]:
+    """Create files (or directories, for paths ending in "/") under a root."""
+
+    def write(root: Path, files: Dict[str, str]) -> None:
+        for rel_path, content in files.items():
+            path = root / rel_path
+            if rel_path.endswith("/"):
+                path.mkdir(parents=True, exist_ok=True)
+            else:
+                path.parent.mkdir(parents=True, exist_ok=True)
+                path.write_text(content)
+
+    return write
@@ -0,0 +1,140 @@
+"""Ranking and maintenance of the context summary index."""
+
+import json
+from pathlib import Path
+from typing import Dict, List
+
+import pytest
+
+from super_cc.context_index import SummaryIndex, is_summarizable, tokenize
+
+DIGEST = {
+    "files": [
+        {"path": "src/auth.py", "main_roles": ["authentication", "session management"],
+         "apis": ["login", "logout"], "todos": ["add 2FA support"]},
+        {"path": "src/db.py", "main_roles": ["storage"], "apis": ["connect"],
+         "cross_cutting": ["retries"]},
+    ],
+    "cross_cutting": ["error handling patterns", "logging framework"],
+}
+SINGLE_FILES = {
+    "src__tokens.py": {"path": "src/tokens.py", "main_roles": ["auth token issuing"],
+                       "apis": ["issueAuthToken"]},
+    "src__render.py": {"path": "src/render.py", "main_roles": ["html rendering"],
+                       "apis": ["render_page"]},
+}
+
+
+def _write_summary(repo: Path, name: str, data: Dict) -> Path:
+    path = repo / ".claude" / "context" / "summaries" / f"{name}_summary.json"
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(data))
+    return path
+
+
+@pytest.fixture
+def repo(tmp_path: Path) -> Path:
+    _write_summary(tmp_path, "digest", DIGEST)
+    for name, data in SINGLE_FILES.items():
+        _write_summary(tmp_path, name, data)
+    return tmp_path
+
+
+def _ranked(repo: Path, text: str) -> List[str]:
+    index = SummaryIndex(repo)
+    index.refresh()
+    return [result.path for result in index.query(text)]
+
+
+def test_tokenize_splits_identifiers_and_stems() -> None:
+    assert list(tokenize("issueAuthTokens in session_managers")) == [
+        "issue", "auth", "token", "session", "manager",
+    ]
+
+
+def test_exact_terms_rank_first(repo: Path) -> None:
+    assert _ranked(repo, "authentication")[0] == "src/auth.py"
+    assert _ranked(repo, "render page")[0] == "src/render.py"
+
+
+def test_query_term_prefixes_longer_index_terms(repo: Path) -> None:
+    assert "src/auth.py" in _ranked(repo, "authent")
+
+
+def test_index_term_prefixes_longer_query_term(repo: Path) -> None:
+    # "authentication" in the query also finds summaries that only say "auth"
+    results = _ranked(repo, "which files implement authentication")
+    assert results[:2] == ["src/auth.py", "src/tokens.py"]
+
+
+def test_digest_cross_cutting_applies_to_every_entry(repo: Path) -> None:
+    assert set(_ranked(repo, "logging")) == {"src/auth.py", "src/db.py"}
+    assert _ranked(repo, "retries") == ["src/db.py"]
+
+
+def test_refresh_is_incremental(repo: Path) -> None:
+    index = SummaryIndex(repo)
+    assert index.refresh() == (3, 0)
+    assert SummaryIndex(repo).refresh() == (0, 0)
+
+    _write_summary(repo, "src__render.py", {"path": "src/render.py", "main_roles": ["templating"]})
+    assert SummaryIndex(repo).refresh() == (1, 0)
+    assert _ranked(repo, "templating") == ["src/render.py"]
+
+
+def test_deleted_summary_file_is_dropped(repo: Path) -> None:
+    SummaryIndex(repo).refresh()
+    (repo / ".claude" / "context" / "summaries" / "src__tokens.py_summary.json").unlink()
+
+    index = SummaryIndex(repo)
+    assert index.refresh() == (0, 1)
+    assert "src/tokens.py" not in index.paths()
+    assert "src/tokens.py" not in _ranked(repo, "token")
+
+
+def test_forget_removes_single_files_and_digest_entries(repo: Path) -> None:
+    index = SummaryIndex(repo)
+    index.refresh()
+    assert index.forget(["src/tokens.py", "src/db.py", "src/missing.py"]) == 2
+
+    summaries = repo / ".claude" / "context" / "summaries"
+    assert not (summaries / "src__tokens.py_summary.json").exists()
+    digest = json.loads((summaries / "digest_summary.json").read_text())
+    assert [entry["path"] for entry in digest["files"]] == ["src/auth.py"]
+    assert digest["cross_cutting"] == DIGEST["cross_cutting"]
+
+    index = SummaryIndex(repo)
+    index.refresh()
+    assert index.paths() == ["src/auth.py", "src/render.py"]
+
+
+def test_forget_directory(repo: Path) -> None:
+    index = SummaryIndex(repo)
+    index.refresh()
+    assert index.forget(["src"]) == 4
+
+
+def test_entries_for_selected_paths(repo: Path) -> None:
+    index = SummaryIndex(repo)
+    index.refresh()
+    entries = {path: entry for path, entry, _ in index.entries(["src/db.py", "src/render.py"])}
+    assert set(entries) == {"src/db.py", "src/render.py"}
+    assert entries["src/db.py"]["cross_cutting"][0] == "retries"
+
+
+def test_uninitialized_repo_is_left_untouched(tmp_path: Path) -> None:
+    index = SummaryIndex(tmp_path)
+    assert index.refresh() == (0, 0)
+    assert index.query("anything") == []
+    assert not (tmp_path / ".claude").exists()
+
+
+@pytest.mark.parametrize("path, expected", [
+    ("src/app.py", True),
+    ("web/App.TSX", True),
+    ("README.md", False),
+    ("package-lock.json", False),
+    ("assets/logo.png", False),
+])
+def test_is_summarizable(path: str, expected: bool) -> None:
+    assert is_summarizable(path) is expected
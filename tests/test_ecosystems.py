@@ -0,0 +1,115 @@
+"""Project detection, its cache and path-to-project lookup."""
+
+import json
+from pathlib import Path
+from typing import Callable, Dict
+
+import pytest
+from conftest import run_git
+
+from super_cc.ecosystems import (
+    EcosystemDetector,
+    Project,
+    group_by_ecosystem,
+    project_for,
+)
+
+WriteFiles = Callable[[Path, Dict[str, str]], None]
+
+MONOREPO = {
+    ".gitignore": "generated/\n",
+    "package.json": "{}",
+    "requirements.txt": "",
+    "services/api/pyproject.toml": "",
+    "services/api/src/app.py": "",
+    "services/worker/go.mod": "",
+    "crates/core/Cargo.toml": "",
+    "generated/client/package.json": "{}",
+    "node_modules/dep/package.json": "{}",
+    "crates/core/target/package.json": "{}",
+}
+PROJECTS = [
+    Project("", ("node", "python")),
+    Project("crates/core", ("rust",)),
+    Project("services/api", ("python",)),
+    Project("services/worker", ("go",)),
+]
+
+
+@pytest.fixture
+def monorepo(git_repo: Path, write_files: WriteFiles) -> Path:
+    write_files(git_repo, MONOREPO)
+    run_git(git_repo, "add", "-A")
+    run_git(git_repo, "commit", "-q", "-m", "init")
+    return git_repo
+
+
+def test_detect_skips_ignored_and_vendored(monorepo: Path) -> None:
+    assert EcosystemDetector(monorepo).detect(use_cache=False) == PROJECTS
+
+
+def test_cache_hit_skips_the_scan(monorepo: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    detector = EcosystemDetector(monorepo)
+    assert detector.detect() == PROJECTS
+    cache = json.loads(detector.cache_path.read_text())
+    assert cache["tree"] == run_git(monorepo, "rev-parse", "HEAD^{tree}").strip()
+    assert set(cache["markers"]) == {
+        "package.json", "requirements.txt", "services/api/pyproject.toml",
+        "services/worker/go.mod", "crates/core/Cargo.toml",
+    }
+
+    monkeypatch.setattr(EcosystemDetector, "_scan", lambda self: pytest.fail("rescanned"))
+    assert EcosystemDetector(monorepo).detect() == PROJECTS
+
+
+def test_removed_marker_invalidates_cache(monorepo: Path) -> None:
+    EcosystemDetector(monorepo).detect()
+    (monorepo / "services" / "worker" / "go.mod").unlink()
+    assert Project("services/worker", ("go",)) not in EcosystemDetector(monorepo).detect()
+
+
+def test_edited_marker_invalidates_cache(monorepo: Path) -> None:
+    detector = EcosystemDetector(monorepo)
+    detector.detect()
+    (monorepo / "requirements.txt").write_text("pytest\n")
+    assert detector._read_cache(detector._cache_key() or "") is None
+
+
+def test_new_commit_invalidates_cache(monorepo: Path, write_files: WriteFiles) -> None:
+    EcosystemDetector(monorepo).detect()
+    write_files(monorepo, {"tools/cli/go.mod": ""})
+    run_git(monorepo, "add", "-A")
+    run_git(monorepo, "commit", "-q", "-m", "add cli")
+    assert Project("tools/cli", ("go",)) in EcosystemDetector(monorepo).detect()
+
+
+def test_no_cache_outside_git(tmp_path: Path, write_files: WriteFiles) -> None:
+    write_files(tmp_path, {"go.mod": ""})
+    detector = EcosystemDetector(tmp_path)
+    assert detector.detect() == [Project("", ("go",))]
+    assert not detector.cache_path.exists()
+
+
+@pytest.mark.parametrize("path, root", [
+    ("services/api/src/app.py", "services/api"),
+    ("services/api", "services/api"),
+    ("services/api2/x.py", ""),
+    ("crates/core/src/lib.rs", "crates/core"),
+    ("README.md", ""),
+])
+def test_project_for_picks_innermost(path: str, root: str) -> None:
+    project = project_for(PROJECTS, path)
+    assert project is not None and project.root == root
+
+
+def test_project_for_without_root_project() -> None:
+    assert project_for(PROJECTS[1:], "README.md") is None
+
+
+def test_group_by_ecosystem() -> None:
+    assert group_by_ecosystem(PROJECTS) == {
+        "node": ["."],
+        "python": [".", "services/api"],
+        "rust": ["crates/core"],
+        "go": ["services/worker"],
+    }
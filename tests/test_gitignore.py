@@ -0,0 +1,156 @@
+"""GitignoreMatcher checked against git check-ignore."""
+
+import time
+from pathlib import Path
+from typing import Callable, Dict, List, Set
+
+import pytest
+from conftest import run_git
+
+from super_cc.gitignore import GitignoreMatcher, walk
+from super_cc.integration import GitignoreManager
+
+WriteFiles = Callable[[Path, Dict[str, str]], None]
+
+CASES = {
+    "negation_under_ignored_dir": (
+        {".gitignore": "build/\n!build/keep/\n!build/keep.txt\nlogs/*\n!logs/important.log\n"},
+        ["build/x.o", "build/keep/k.txt", "build/keep.txt", "buildx", "logs/a.log",
+         "logs/important.log"],
+    ),
+    "double_star": (
+        {".gitignore": "**/foo\nabc/**\na/**/b\nx**y\n**/deep/**/leaf\n"},
+        ["foo", "d/foo", "d/e/foo", "abc/x", "abc/d/y", "a/b", "a/x/b", "a/x/y/b", "xay",
+         "xa/y", "deep/leaf", "p/deep/q/r/leaf", "p/deep2/leaf"],
+    ),
+    "dir_only": (
+        {".gitignore": "tmp/\n*.d/\ncache/\n"},
+        ["tmp/f", "s/tmp", "s/tmp2/tmp/f", "x.d/f", "y.d", "cache"],
+    ),
+    "nested_gitignore": (
+        {".gitignore": "*.log\nlocal\n", "sub/.gitignore": "!keep.log\n/only-here\n*.tmp\n"},
+        ["a.log", "sub/keep.log", "sub/x.log", "sub/local", "sub/deep/keep.log",
+         "sub/only-here", "sub/deep/only-here", "only-here", "x.tmp", "sub/x.tmp"],
+    ),
+    "bracket_classes": (
+        {".gitignore": "[[:digit:]]x\n[!a-c]y\n[[:upper:]][[:lower:]]z\nq[]]\n[a-]w\n"
+                       "[[:alpha:][:digit:]]v\n[[:space:]]s\n[[:punct:]]p\n"},
+        ["1x", "ax", "dy", "by", "Abz", "abz", "q]", "-w", "aw", "bw", "3v", "_v", " s",
+         "-p", "ap"],
+    ),
+    "anchoring_and_affixes": (
+        {".gitignore": "/root.txt\ndoc/*.txt\n*.py[co]\n*.log\n!important.log\ndebug*\n"
+                       "!debug-keep\n*.gen1\n*.gen2\n"},
+        ["root.txt", "sub/root.txt", "doc/a.txt", "doc/sub/a.txt", "x.pyc", "x.pyo", "x.pyd",
+         "a.log", "important.log", "sub/important.log", "debug-x", "debug-keep", "f.gen1",
+         "f.gen3", "sub/debugger"],
+    ),
+    "escapes_and_spaces": (
+        {".gitignore": "\\#hash\n\\!bang\nspace\\ \ntrail   \n# comment\n"},
+        ["#hash", "!bang", "space ", "trail", "trail   ", "# comment"],
+    ),
+}
+
+
+def _git_ignored(repo: Path, paths: List[str]) -> Set[str]:
+    output = run_git(repo, "check-ignore", "--no-index", "--stdin", stdin="\n".join(paths) + "\n")
+    return set(output.splitlines())
+
+
+def _matcher_ignored(repo: Path, paths: List[str]) -> Set[str]:
+    matcher = GitignoreMatcher(repo)
+    return {p for p in paths if matcher.is_ignored(p, is_dir=(repo / p).is_dir())}
+
+
+@pytest.mark.parametrize("name", sorted(CASES))
+def test_matches_git_check_ignore(name: str, git_repo: Path, write_files: WriteFiles) -> None:
+    ignore_files, paths = CASES[name]
+    write_files(git_repo, ignore_files)
+    write_files(git_repo, dict.fromkeys(paths, ""))
+    assert _matcher_ignored(git_repo, paths) == _git_ignored(git_repo, paths)
+
+
+def test_info_exclude_has_lowest_precedence(git_repo: Path, write_files: WriteFiles) -> None:
+    write_files(git_repo, {
+        ".git/info/exclude": "secret\nexcluded-only\n",
+        ".gitignore": "!secret\n",
+        "secret": "",
+        "excluded-only": "",
+        "other": "",
+    })
+    paths = ["secret", "excluded-only", "other"]
+    assert _matcher_ignored(git_repo, paths) == _git_ignored(git_repo, paths) == {"excluded-only"}
+
+
+def test_extra_patterns(git_repo: Path) -> None:
+    matcher = GitignoreMatcher(git_repo, [".claude/logs/"])
+    assert matcher.is_ignored(".claude/logs/run.json")
+    assert not matcher.is_ignored(".claude/agents/a.md")
+
+
+def test_walk_prunes_ignored_directories(git_repo: Path, write_files: WriteFiles) -> None:
+    write_files(git_repo, {
+        ".gitignore": "build/\n*.tmp\n",
+        "src/a.py": "",
+        "src/b.tmp": "",
+        "build/out.js": "",
+        "node_modules/x.js": "",
+    })
+    seen = {
+        f"{rel_dir}/{entry.name}" if rel_dir else entry.name
+        for rel_dir, _, files in walk(GitignoreMatcher(git_repo), skip=(".git", "node_modules"))
+        for entry in files
+    }
+    assert seen == {".gitignore", "src/a.py"}
+
+
+def test_many_affix_rules_stay_fast(git_repo: Path, write_files: WriteFiles) -> None:
+    rules = [f"*.gen{i}" for i in range(3000)] + [f"tmp{i}*" for i in range(1000)]
+    write_files(git_repo, {".gitignore": "\n".join(rules) + "\n"})
+    matcher = GitignoreMatcher(git_repo)
+    start = time.perf_counter()
+    for i in range(5000):
+        matcher.is_ignored(f"src/d{i % 50}/file{i}.py")
+    assert time.perf_counter() - start < 1.0
+    assert matcher.is_ignored("x.gen2999") and matcher.is_ignored("tmp999x")
+
+
+class TestGitignoreManager:
+    def test_equivalent_patterns_count_as_present(self, git_repo: Path, write_files: WriteFiles) -> None:
+        write_files(git_repo, {".gitignore": ".claude/\n"})
+        assert GitignoreManager(git_repo)._find_missing_entries() == set()
+
+    def test_partial_coverage(self, git_repo: Path, write_files: WriteFiles) -> None:
+        write_files(git_repo, {".gitignore": "/.claude/logs\n.claude/state/\n*.log\n"})
+        missing = GitignoreManager(git_repo)._find_missing_entries()
+        assert missing == {
+            ".claude/cache/",
+            ".claude/context/summaries/",
+            ".claude/context/last-build-commit",
+        }
+
+    def test_exclude_file_counts(self, git_repo: Path, write_files: WriteFiles) -> None:
+        write_files(git_repo, {".git/info/exclude": ".claude\n"})
+        assert GitignoreManager(git_repo)._find_missing_entries() == set()
+
+    @pytest.mark.parametrize("existing, separator", [
+        ("node_modules/", "\n\n"),
+        ("node_modules/\n", "\n"),
+        ("", ""),
+    ])
+    def test_append_newline_handling(self, git_repo: Path, existing: str, separator: str) -> None:
+        gitignore = git_repo / ".gitignore"
+        gitignore.write_text(existing)
+        GitignoreManager(git_repo)._append_missing_entries({".claude/state/", ".claude/cache/"})
+        assert gitignore.read_text() == (
+            existing + separator + "# Super CC additions:\n.claude/cache/\n.claude/state/\n"
+        )
+
+    def test_append_creates_missing_file(self, git_repo: Path) -> None:
+        GitignoreManager(git_repo)._append_missing_entries({".claude/logs/"})
+        assert (git_repo / ".gitignore").read_text() == "# Super CC additions:\n.claude/logs/\n"
+
+    def test_appended_entries_are_then_found(self, git_repo: Path) -> None:
+        manager = GitignoreManager(git_repo)
+        manager._append_missing_entries(manager._find_missing_entries())
+        assert manager._find_missing_entries() == set()
@@ -0,0 +1,44 @@
+"""Startup budget for the quick super-cc invocations."""
+
+import os
+from typing import List
+
+import pytest
+
+from benchmarks.import_time import (
+    DEFAULT_BUDGET_MS,
+    FAST_INVOCATIONS,
+    FORBIDDEN_MODULES,
+    imported_modules,
+    run_cli,
+)
+
+BUDGET_MS = float(os.environ.get("SUPER_CC_IMPORT_BUDGET_MS", DEFAULT_BUDGET_MS))
+RUNS = 5
+
+
+@pytest.mark.parametrize("args", FAST_INVOCATIONS, ids=" ".join)
+def test_no_heavy_imports(args: List[str]) -> None:
+    _, trace = run_cli(args, importtime=True)
+    leaked = FORBIDDEN_MODULES & set(imported_modules(trace))
+    assert not leaked, f"super-cc {' '.join(args)} imported {', '.join(sorted(leaked))}"
+
+
+@pytest.mark.parametrize("args", FAST_INVOCATIONS, ids=" ".join)
+def test_cli_import_within_budget(args: List[str]) -> None:
+    # Cumulative import time of super_cc.cli, which ignores interpreter startup noise
+    best_us = min(
+        imported_modules(run_cli(args, importtime=True)[1]).get("super_cc.cli", 0)
+        for _ in range(RUNS)
+    )
+    assert best_us / 1000 <= BUDGET_MS, (
+        f"importing super_cc.cli took {best_us / 1000:.1f} ms (budget {BUDGET_MS:.0f} ms)"
+    )
+
+
+@pytest.mark.parametrize("args", FAST_INVOCATIONS, ids=" ".join)
+def test_wall_time_within_budget(args: List[str]) -> None:
+    best_ms = min(run_cli(args)[0] for _ in range(RUNS))
+    assert best_ms <= BUDGET_MS, (
+        f"super-cc {' '.join(args)} took {best_ms:.1f} ms (budget {BUDGET_MS:.0f} ms)"
+    )
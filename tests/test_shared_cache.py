@@ -0,0 +1,150 @@
+"""Publishing to and restoring from the shared summary cache."""
+
+import json
+import os
+from pathlib import Path
+from typing import Callable, Dict
+
+import pytest
+from conftest import run_git
+
+from super_cc.shared_cache import (
+    LocalCacheBackend,
+    SharedSummaryCache,
+    blob_sha,
+    resolve_cache_dir,
+)
+
+WriteFiles = Callable[[Path, Dict[str, str]], None]
+
+SOURCES = {
+    "src/auth.py": "def login(): ...\n",
+    "src/db.py": "def connect(): ...\n",
+}
+
+
+def _summaries(repo: Path) -> Path:
+    return repo / ".claude" / "context" / "summaries"
+
+
+def _write_summary(repo: Path, rel_path: str, **fields: object) -> Path:
+    path = _summaries(repo) / (rel_path.replace("/", "__") + "_summary.json")
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(dict(fields, path=rel_path)))
+    return path
+
+
+def _age(path: Path, seconds: int) -> None:
+    """Move a file's mtime into the past."""
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns - seconds * 10**9))
+
+
+@pytest.fixture
+def backend(tmp_path: Path) -> LocalCacheBackend:
+    return LocalCacheBackend(tmp_path / "shared")
+
+
+@pytest.fixture
+def clone(tmp_path: Path, write_files: WriteFiles) -> Path:
+    repo = tmp_path / "clone"
+    write_files(repo, SOURCES)
+    for rel_path in SOURCES:
+        _age(repo / rel_path, 60)
+    return repo
+
+
+def test_blob_sha_matches_git(git_repo: Path) -> None:
+    path = git_repo / "file.txt"
+    path.write_bytes(b"hello\x00world\n")
+    assert blob_sha(path) == run_git(git_repo, "hash-object", "file.txt").strip()
+
+
+def test_resolve_cache_dir(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    monkeypatch.delenv("SUPER_CC_SHARED_CACHE", raising=False)
+    assert resolve_cache_dir() is None
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    assert resolve_cache_dir("user") == tmp_path / "super-cc" / "summaries"
+    monkeypatch.setenv("SUPER_CC_SHARED_CACHE", str(tmp_path / "team"))
+    assert resolve_cache_dir() == tmp_path / "team"
+
+
+def test_push_publishes_agent_written_summaries(
+    clone: Path, backend: LocalCacheBackend, tmp_path: Path, write_files: WriteFiles
+) -> None:
+    _write_summary(clone, "src/auth.py", main_roles=["authentication"])
+    _write_summary(clone, "src/db.py", main_roles=["storage"])
+    cache = SharedSummaryCache(clone, backend, version="test")
+    assert cache.publish() == 2
+    # The SHA is recorded, so later pushes skip entries already shared
+    summary = json.loads((_summaries(clone) / "src__auth.py_summary.json").read_text())
+    assert summary["blob"] == blob_sha(clone / "src/auth.py")
+    assert cache.publish() == 0
+
+    # Another clone with the same content restores instead of summarizing
+    other = tmp_path / "other"
+    write_files(other, SOURCES)
+    restorer = SharedSummaryCache(other, backend, version="test")
+    assert restorer.restore(sorted(SOURCES) + ["src/missing.py"]) == sorted(SOURCES)
+    restored = json.loads((_summaries(other) / "src__auth.py_summary.json").read_text())
+    assert restored == {"main_roles": ["authentication"], "path": "src/auth.py",
+                        "blob": blob_sha(other / "src/auth.py")}
+    assert restorer.stats() == {"hits": 2, "misses": 0, "stores": 0, "hit_rate": 1.0}
+
+
+def test_push_skips_stale_summaries(clone: Path, backend: LocalCacheBackend) -> None:
+    _write_summary(clone, "src/auth.py", main_roles=["authentication"])
+    _write_summary(clone, "src/db.py", main_roles=["storage"], blob="0" * 40)
+    # Saved after its summary was written
+    (clone / "src/auth.py").write_text("def login(user): ...\n")
+    _age(_summaries(clone) / "src__auth.py_summary.json", 60)
+    assert SharedSummaryCache(clone, backend, version="test").publish() == 0
+
+
+def test_push_publishes_digest_entries(clone: Path, backend: LocalCacheBackend) -> None:
+    digest = _summaries(clone) / "digest_summary.json"
+    digest.parent.mkdir(parents=True)
+    digest.write_text(json.dumps({"files": [
+        {"path": "src/auth.py", "main_roles": ["authentication"]},
+        {"path": "src/db.py", "main_roles": ["storage"]},
+    ]}))
+    assert SharedSummaryCache(clone, backend, version="test").publish() == 2
+    assert all("blob" in entry for entry in json.loads(digest.read_text())["files"])
+
+
+def test_publish_with_blobs_requires_unchanged_content(
+    clone: Path, backend: LocalCacheBackend
+) -> None:
+    before = {rel_path: blob_sha(clone / rel_path) for rel_path in SOURCES}
+    _write_summary(clone, "src/auth.py", main_roles=["authentication"])
+    _write_summary(clone, "src/db.py", main_roles=["storage"])
+    # Saved again while the summarizer ran
+    (clone / "src/db.py").write_text("def connect(url): ...\n")
+
+    cache = SharedSummaryCache(clone, backend, version="test")
+    assert cache.publish(before) == 1
+    assert backend.contains("test", before["src/auth.py"])
+    assert not backend.contains("test", before["src/db.py"])
+
+
+def test_versions_are_isolated(clone: Path, backend: LocalCacheBackend) -> None:
+    _write_summary(clone, "src/auth.py", main_roles=["authentication"])
+    SharedSummaryCache(clone, backend, version="v1").publish()
+    assert SharedSummaryCache(clone, backend, version="v2").restore(["src/auth.py"]) == []
+
+
+def test_flush_stats_accumulates(clone: Path, backend: LocalCacheBackend) -> None:
+    cache = SharedSummaryCache(clone, backend, version="test")
+    cache.restore(["src/auth.py"])
+    assert cache.flush_stats() == {
+        "hits": 0, "misses": 1, "stores": 0, "hit_rate": 0.0, "backend": str(backend.root),
+    }
+    assert cache.stats()["hit_rate"] is None
+
+    _write_summary(clone, "src/auth.py", main_roles=["authentication"])
+    cache.publish()
+    cache.restore(["src/auth.py"])
+    totals = cache.flush_stats()
+    assert (totals["hits"], totals["misses"], totals["stores"], totals["hit_rate"]) == (1, 1, 1, 0.5)
+    saved = json.loads(cache.stats_path.read_text())
+    assert saved["shared_cache"] == totals
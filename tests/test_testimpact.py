@@ -0,0 +1,235 @@
+"""Coverage ingestion and test selection."""
+
+import sqlite3
+import sys
+from pathlib import Path
+from typing import Callable, Dict, List, Tuple
+
+import pytest
+
+from super_cc.testimpact import Selection, TestImpactIndex, build_commands
+
+WriteFiles = Callable[[Path, Dict[str, str]], None]
+
+SOURCES = {
+    "src/auth.py": "def login(user):\n    return user\n",
+    "src/db.py": "def connect():\n    return 1\n",
+    "src/util.py": "def helper():\n    return 2\n",
+    "tests/test_auth.py": "",
+    "tests/test_db.py": "",
+    "pyproject.toml": "",
+}
+
+LCOV = """\
+TN:src/auth.test.ts
+SF:{root}/src/auth.ts
+DA:1,1
+DA:2,0
+end_of_record
+SF:{root}/src/unused.ts
+DA:1,0
+end_of_record
+SF:/elsewhere/node_modules/lib.js
+DA:1,3
+end_of_record
+TN:src/db.test.ts > connects
+SF:src/db.ts
+DA:4,2
+end_of_record
+"""
+
+
+def _coverage_db(path: Path, rows: List[Tuple[str, str]]) -> Path:
+    """Write a coverage.py data file with the tables the reader uses."""
+    with sqlite3.connect(path) as db:
+        db.executescript(
+            "CREATE TABLE file (id INTEGER PRIMARY KEY, path TEXT UNIQUE);"
+            "CREATE TABLE context (id INTEGER PRIMARY KEY, context TEXT UNIQUE);"
+            "CREATE TABLE line_bits (file_id INTEGER, context_id INTEGER, numbits BLOB);"
+        )
+        for file_path, context in rows:
+            db.execute("INSERT OR IGNORE INTO file (path) VALUES (?)", (file_path,))
+            db.execute("INSERT OR IGNORE INTO context (context) VALUES (?)", (context,))
+            db.execute(
+                "INSERT INTO line_bits SELECT file.id, context.id, x'01' FROM file, context "
+                "WHERE file.path = ? AND context.context = ?",
+                (file_path, context),
+            )
+    db.close()
+    return path
+
+
+@pytest.fixture
+def repo(tmp_path: Path, write_files: WriteFiles) -> Path:
+    write_files(tmp_path, SOURCES)
+    return tmp_path
+
+
+@pytest.fixture
+def index(repo: Path, tmp_path_factory: pytest.TempPathFactory) -> TestImpactIndex:
+    data = _coverage_db(tmp_path_factory.mktemp("cov") / ".coverage", [
+        (str(repo / "src/auth.py"), "tests/test_auth.py::test_login|run"),
+        (str(repo / "src/db.py"), "tests/test_auth.py::test_login|run"),
+        (str(repo / "src/db.py"), "tests/test_db.py::test_connect|run"),
+        (str(repo / "src/db.py"), "tests/test_db.py::TestPool::test_reuse|setup"),
+        ("/usr/lib/python3/site.py", "tests/test_db.py::test_connect|run"),
+        (str(repo / "src/util.py"), ""),
+    ])
+    index = TestImpactIndex(repo)
+    assert index.ingest(data) == 3
+    return index
+
+
+def test_read_coveragepy_contexts(index: TestImpactIndex) -> None:
+    assert index.files == {
+        "src/auth.py": {"tests/test_auth.py::test_login"},
+        "src/db.py": {"tests/test_auth.py::test_login", "tests/test_db.py::test_connect",
+                      "tests/test_db.py::TestPool::test_reuse"},
+    }
+    assert set(index.tests.values()) == {"pytest"}
+
+
+def test_read_real_coveragepy_data(repo: Path, tmp_path: Path) -> None:
+    coverage = pytest.importorskip("coverage")
+    data_file = tmp_path / ".coverage"
+    cov = coverage.Coverage(data_file=str(data_file), include=[str(repo / "src" / "*")])
+    sys.path.insert(0, str(repo / "src"))
+    try:
+        cov.start()
+        cov.switch_context("tests/test_auth.py::test_login|run")
+        __import__("auth").login("ada")
+        cov.switch_context("tests/test_db.py::test_connect|run")
+        __import__("db").connect()
+        cov.stop()
+        cov.save()
+    finally:
+        sys.path.remove(str(repo / "src"))
+        sys.modules.pop("auth", None)
+        sys.modules.pop("db", None)
+
+    index = TestImpactIndex(repo)
+    index.ingest(data_file)
+    assert index.files["src/db.py"] == {"tests/test_db.py::test_connect"}
+    assert "tests/test_auth.py::test_login" in index.files["src/auth.py"]
+
+
+def test_read_lcov(repo: Path, tmp_path: Path) -> None:
+    tracefile = tmp_path / "lcov.info"
+    tracefile.write_text(LCOV.format(root=repo))
+    index = TestImpactIndex(repo)
+    assert index.ingest(tracefile) == 2
+    assert index.files == {
+        "src/auth.ts": {"src/auth.test.ts"},
+        "src/db.ts": {"src/db.test.ts > connects"},
+    }
+    assert set(index.tests.values()) == {"vitest"}
+
+
+def test_lcov_without_test_names(repo: Path, tmp_path: Path) -> None:
+    tracefile = tmp_path / "lcov.info"
+    tracefile.write_text("SF:src/lib.rs\nDA:3,1\nend_of_record\n")
+    index = TestImpactIndex(repo)
+    assert index.ingest(tracefile, runner="cargo") == 0
+    assert index.ingest(tracefile, runner="cargo", test_name="tests/parse") == 1
+    assert index.files == {"src/lib.rs": {"tests/parse"}}
+
+
+def test_unknown_runner(repo: Path, tmp_path: Path) -> None:
+    tracefile = tmp_path / "lcov.info"
+    tracefile.write_text("")
+    with pytest.raises(ValueError, match="Unknown runner"):
+        TestImpactIndex(repo).ingest(tracefile, runner="jest")
+
+
+def test_reingest_replaces_a_tests_mappings(index: TestImpactIndex, repo: Path, tmp_path: Path) -> None:
+    data = _coverage_db(tmp_path / "again.coverage", [
+        (str(repo / "src/util.py"), "tests/test_auth.py::test_login|run"),
+    ])
+    index.ingest(data)
+    assert index.files["src/util.py"] == {"tests/test_auth.py::test_login"}
+    assert "src/auth.py" not in index.files
+    assert "tests/test_auth.py::test_login" not in index.files["src/db.py"]
+
+
+def test_select_by_coverage(index: TestImpactIndex) -> None:
+    selection = index.select(["src/db.py"], full_every=0)
+    assert not selection.full
+    assert selection.tests == {"pytest": [
+        "tests/test_auth.py::test_login",
+        "tests/test_db.py::TestPool::test_reuse",
+        "tests/test_db.py::test_connect",
+    ]}
+    assert index.select(["src/util.py"], full_every=0).tests == {}
+
+
+@pytest.mark.parametrize("changed, reason", [
+    (["pyproject.toml"], "configuration changed"),
+    (["src/auth.py", "requirements-dev.txt"], "configuration changed"),
+    (["web/package.json"], "configuration changed"),
+])
+def test_config_changes_trigger_full_run(index: TestImpactIndex, changed: List[str], reason: str) -> None:
+    selection = index.select(changed, full_every=0)
+    assert selection.full and selection.reason.startswith(reason)
+
+
+def test_full_run_without_coverage(repo: Path) -> None:
+    selection = TestImpactIndex(repo).select(["src/auth.py"])
+    assert selection.full and selection.reason == "no coverage data ingested yet"
+    assert TestImpactIndex(repo).select(["src/auth.py"], force_full=True).reason == "full run requested"
+
+
+def test_periodic_full_run(index: TestImpactIndex, repo: Path) -> None:
+    results = [index.select(["src/auth.py"], full_every=3).full for _ in range(6)]
+    assert results == [False, False, True, False, False, True]
+    # The counter survives across processes
+    index.select(["src/auth.py"], full_every=3)
+    assert TestImpactIndex(repo).runs_since_full == 1
+
+
+def test_edited_test_file_runs_whole(index: TestImpactIndex, write_files: WriteFiles, repo: Path) -> None:
+    write_files(repo, {"tests/test_new.py": "", "pkg/store_test.go": ""})
+    selection = index.select(
+        ["src/auth.py", "tests/test_db.py", "tests/test_new.py", "pkg/store_test.go"], full_every=0
+    )
+    assert selection.tests == {
+        "pytest": ["tests/test_auth.py::test_login", "tests/test_db.py", "tests/test_new.py"],
+        "go": ["pkg::"],
+    }
+
+
+def test_deleted_test_file_is_forgotten(index: TestImpactIndex, repo: Path) -> None:
+    (repo / "tests" / "test_db.py").unlink()
+    selection = index.select(["src/db.py", "tests/test_db.py"], full_every=0)
+    assert selection.tests == {"pytest": ["tests/test_auth.py::test_login"]}
+    assert all(not t.startswith("tests/test_db.py") for t in TestImpactIndex(repo).tests)
+
+
+def test_deleted_source_file_is_forgotten(index: TestImpactIndex, repo: Path) -> None:
+    (repo / "src" / "auth.py").unlink()
+    assert index.select(["src/auth.py"], full_every=0).tests == {}
+    assert "src/auth.py" not in TestImpactIndex(repo).files
+
+
+def test_build_commands() -> None:
+    selection = Selection(False, "", {
+        "pytest": ["tests/test_a.py::test_x"],
+        "vitest": ["src/a.test.ts > works", "src/a.test.ts > fails", "src/b.test.ts"],
+        "go": ["pkg/store::TestGet", "pkg/store::TestPut", "cmd::", "cmd::TestMain", ".::TestRoot"],
+        "cargo": ["tests::parse", "lexer::tokens"],
+    }, [])
+    assert build_commands(selection) == [
+        ["pytest", "tests/test_a.py::test_x"],
+        ["vitest", "run", "src/a.test.ts", "src/b.test.ts"],
+        ["go", "test", ".", "-run", "^(TestRoot)$"],
+        ["go", "test", "./cmd"],
+        ["go", "test", "./pkg/store", "-run", "^(TestGet|TestPut)$"],
+        ["cargo", "test", "--", "--exact", "tests::parse", "lexer::tokens"],
+    ]
+
+
+def test_full_commands(index: TestImpactIndex, repo: Path, tmp_path: Path) -> None:
+    assert index.full_commands() == [["pytest"]]
+    tracefile = tmp_path / "lcov.info"
+    tracefile.write_text("SF:src/lib.rs\nDA:3,1\nend_of_record\n")
+    index.ingest(tracefile, runner="cargo", test_name="parse")
+    assert index.full_commands() == [["pytest"], ["cargo", "test"]]
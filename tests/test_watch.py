@@ -0,0 +1,105 @@
+"""Batching, command building and change detection of the watcher."""
+
+import json
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Callable, Dict, List, Set
+
+import pytest
+
+from super_cc.context_index import SummaryIndex
+from super_cc.watch import CommandSummarizer, RepoWatcher, _chunks, _diff
+
+WriteFiles = Callable[[Path, Dict[str, str]], None]
+
+# Writes a single-file summary for every path it is given, like /context-synth
+STUB_SUMMARIZER = """
+import json, sys
+from pathlib import Path
+out = Path(".claude/context/summaries")
+out.mkdir(parents=True, exist_ok=True)
+for path in sys.argv[1:]:
+    name = path.replace("/", "__") + "_summary.json"
+    (out / name).write_text(json.dumps({"path": path, "main_roles": ["stub summary"]}))
+"""
+
+
+def test_chunks_respect_byte_limit() -> None:
+    files = [f"src/file{i:02d}.py" for i in range(10)]  # 15 bytes + separator each
+    chunks = list(_chunks(files, 50))
+    assert [len(chunk) for chunk in chunks] == [3, 3, 3, 1]
+    assert sum(chunks, []) == files
+
+
+def test_oversized_path_gets_its_own_chunk() -> None:
+    assert list(_chunks(["a" * 100, "b"], 10)) == [["a" * 100], ["b"]]
+    assert list(_chunks([], 10)) == []
+
+
+def test_diff_reports_added_modified_and_removed() -> None:
+    old = {"a": (1, 1), "b": (1, 1), "c": (1, 1)}
+    new = {"a": (1, 1), "b": (2, 1), "d": (1, 1)}
+    assert _diff(old, new) == {"b", "c", "d"}
+
+
+@pytest.mark.parametrize("template, expected", [
+    ('claude -p "/context-synth {files}"', ["claude", "-p", "/context-synth a.py b c.py"]),
+    ("summarize --files {files} --fast", ["summarize", "--files", "a.py", "b c.py", "--fast"]),
+    ("summarize --out=x", ["summarize", "--out=x"]),
+])
+def test_build_command_expands_files(tmp_path: Path, template: str, expected: List[str]) -> None:
+    summarizer = CommandSummarizer(tmp_path, template)
+    assert summarizer._build_command(["a.py", "b c.py"]) == expected
+
+
+def test_command_summarizer_runs_command_and_forgets_deleted(
+    tmp_path: Path, write_files: WriteFiles
+) -> None:
+    write_files(tmp_path, {
+        "src/app.py": "def main(): ...\n",
+        "README.md": "# docs\n",
+        ".claude/context/summaries/src__old.py_summary.json": json.dumps(
+            {"path": "src/old.py", "main_roles": ["legacy"]}
+        ),
+        "stub.py": STUB_SUMMARIZER,
+    })
+    summarizer = CommandSummarizer(tmp_path, f"{sys.executable} stub.py {{files}}")
+    summarizer({"src/app.py", "README.md", "src/old.py"})
+
+    summaries = tmp_path / ".claude" / "context" / "summaries"
+    assert sorted(p.name for p in summaries.iterdir()) == ["src__app.py_summary.json"]
+    index = SummaryIndex(tmp_path)
+    assert index.refresh() == (0, 0)  # the summarizer already refreshed the index
+    assert [result.path for result in index.query("stub")] == ["src/app.py"]
+
+
+def test_command_summarizer_survives_failing_command(
+    tmp_path: Path, write_files: WriteFiles, capsys: pytest.CaptureFixture
+) -> None:
+    write_files(tmp_path, {"src/app.py": ""})
+    CommandSummarizer(tmp_path, f"{sys.executable} -c 'raise SystemExit(3)' {{files}}")({"src/app.py"})
+    assert "Summarizer exited with 3" in capsys.readouterr().out
+
+
+@pytest.mark.parametrize("force_poll", [False, True])
+def test_gitignore_change_rescans(tmp_path: Path, write_files: WriteFiles, force_poll: bool) -> None:
+    write_files(tmp_path, {".gitignore": "gen/\n", "gen/out.py": "", "src/app.py": ""})
+    batches: List[Set[str]] = []
+    watcher = RepoWatcher(tmp_path, batches.append, debounce=0.05, poll_interval=0.05,
+                          force_poll=force_poll)
+    thread = threading.Thread(target=watcher.run, daemon=True)
+    thread.start()
+    try:
+        time.sleep(0.3)
+        (tmp_path / ".gitignore").write_text("")
+        deadline = time.monotonic() + 5
+        while time.monotonic() < deadline and not any("gen/out.py" in b for b in batches):
+            time.sleep(0.05)
+    finally:
+        watcher.stop()
+        thread.join(5)
+    changed = set().union(*batches)
+    assert "gen/out.py" in changed
+    assert "src/app.py" not in changed